@@ -3,6 +3,7 @@
 import logging
 from typing import List, Optional
 from flask import Blueprint, jsonify, request
+from flask_caching import Cache
 
 from . import database
 from . import config
@@ -16,6 +17,56 @@ logger = logging.getLogger(__name__)
 
 api = Blueprint("api", __name__, url_prefix="/api")
 
+# In-process response cache; initialized against the app in create_app.
+# SimpleCache lives per worker process: /refresh's cache.clear() only
+# reaches the worker that served the refresh, so under multi-worker
+# gunicorn the other workers keep serving their cached entries until
+# those entries' own timeouts lapse (up to 600s for /stats and
+# /filters). Switch CACHE_TYPE to a shared backend such as RedisCache
+# if that staleness window matters for a deployment.
+cache = Cache(config={"CACHE_TYPE": "SimpleCache"})
+
+
+@cache.memoize(timeout=60)
+def _listings_payload(min_price, max_price, min_beds, min_baths, min_sqft,
+                      cities, has_yard, has_pool, has_solar, max_age,
+                      sort_by, sort_dir, limit, offset):
+    """Filtered listings payload, memoized per parameter combination.
+
+    Only the payload is cached - not the whole view - so the search
+    logging in get_listings still runs on cache hits.
+    """
+    # Get filtered, sorted rows from database (sort runs in SQL)
+    rows = database.get_filtered_rows(
+        min_price=min_price,
+        max_price=max_price,
+        min_beds=min_beds,
+        min_baths=min_baths,
+        min_sqft=min_sqft,
+        cities=list(cities) if cities else None,
+        has_yard=has_yard,
+        has_pool=has_pool,
+        has_solar=has_solar,
+        max_age=max_age,
+        sort_by=sort_by,
+        sort_dir=sort_dir,
+        limit=limit,
+        offset=offset,
+    )
+
+    # Serialize rows straight to dicts; building Listing objects per row
+    # just to call to_dict doubles the Python work for no benefit here
+    results = [dict(row) for row in rows]
+    for d in results:
+        for key in ("has_pool", "has_yard", "has_solar", "has_garage", "has_basement"):
+            d[key] = bool(d[key])
+
+    return {
+        "success": True,
+        "count": len(results),
+        "listings": results,
+    }
+
 
 @api.route("/listings", methods=["GET"])
 def get_listings():
@@ -35,6 +86,8 @@ def get_listings():
     - max_age: Maximum age in years
     - sort_by: Field to sort by (default: value_score)
     - sort_dir: Sort direction (asc/desc, default: desc)
+    - limit: Maximum number of results
+    - offset: Number of results to skip (for pagination)
     """
     # Parse query parameters
     min_price = request.args.get("min_price", type=int)
@@ -50,54 +103,31 @@ def get_listings():
     max_age = request.args.get("max_age", type=int)
     sort_by = request.args.get("sort_by", "value_score")
     sort_dir = request.args.get("sort_dir", "desc")
+    limit = request.args.get("limit", type=int)
+    offset = request.args.get("offset", default=0, type=int)
 
     # Convert string booleans
     has_yard = has_yard.lower() == "true" if has_yard else None
     has_pool = has_pool.lower() == "true" if has_pool else None
     has_solar = has_solar.lower() == "true" if has_solar else None
 
-    # Get filtered listings from database
-    listings = database.get_filtered_listings(
-        min_price=min_price,
-        max_price=max_price,
-        min_beds=min_beds,
-        min_baths=min_baths,
-        min_sqft=min_sqft,
-        cities=cities,
-        has_yard=has_yard,
-        has_pool=has_pool,
-        has_solar=has_solar,
-        max_age=max_age,
+    # Cities as a tuple so the memoize key is stable and hashable
+    payload = _listings_payload(
+        min_price, max_price, min_beds, min_baths, min_sqft,
+        tuple(cities) if cities else None,
+        has_yard, has_pool, has_solar, max_age,
+        sort_by, sort_dir, limit, offset,
     )
 
-    # Sort listings
-    reverse = sort_dir.lower() == "desc"
-
-    if sort_by and listings:
-        try:
-            listings.sort(
-                key=lambda l: getattr(l, sort_by) or 0,
-                reverse=reverse
-            )
-        except AttributeError:
-            logger.warning(f"Invalid sort field: {sort_by}")
-
-    # Convert to dict for JSON
-    results = [l.to_dict() for l in listings]
-
-    # Log search
+    # Log every search, including ones served from the payload cache
     database.log_search({
         "min_price": min_price,
         "max_price": max_price,
         "min_beds": min_beds,
         "cities": cities,
-    }, len(results))
+    }, payload["count"])
 
-    return jsonify({
-        "success": True,
-        "count": len(results),
-        "listings": results,
-    })
+    return jsonify(payload)
 
 
 @api.route("/listings/<listing_id>", methods=["GET"])
@@ -108,9 +138,9 @@ def get_listing(listing_id: str):
     if not listing:
         return jsonify({"success": False, "error": "Listing not found"}), 404
 
-    # Get all listings for score breakdown context
-    all_listings = database.get_all_listings()
-    breakdown = get_score_breakdown(listing, all_listings)
+    # Normalization context comes from SQL aggregates, not a full fetch
+    stats = database.get_normalization_stats()
+    breakdown = get_score_breakdown(listing, stats)
 
     return jsonify({
         "success": True,
@@ -143,9 +173,13 @@ def refresh_data():
         # Calculate value scores
         scored = score_all_listings(enriched)
 
-        # Clear old data and save new
-        database.delete_all_listings()
-        database.save_listings(scored)
+        # Swap old data for new in one transaction
+        database.replace_all_listings(scored)
+
+        # Cached responses are stale now. This only clears the worker
+        # that served the refresh; see the cache comment up top for the
+        # staleness window other workers can see.
+        cache.clear()
 
         return jsonify({
             "success": True,
@@ -162,36 +196,22 @@ def refresh_data():
 
 
 @api.route("/filters", methods=["GET"])
+@cache.cached(timeout=600)
 def get_filters():
     """Get available filter options based on current data."""
-    listings = database.get_all_listings()
-
-    # Collect unique values
-    cities = sorted(set(l.city for l in listings if l.city))
-    property_types = sorted(set(l.property_type for l in listings if l.property_type))
-
-    # Get ranges
-    prices = [l.price for l in listings if l.price]
-    sqfts = [l.sqft for l in listings if l.sqft]
-    years = [l.year_built for l in listings if l.year_built]
+    # Unique values and ranges all come from SQL; no listings materialized
+    cities = database.list_distinct("city")
+    property_types = database.list_distinct("property_type")
+    ranges = database.get_filter_ranges()
 
     return jsonify({
         "success": True,
         "filters": {
             "cities": cities,
             "property_types": property_types,
-            "price_range": {
-                "min": min(prices) if prices else 0,
-                "max": max(prices) if prices else 0,
-            },
-            "sqft_range": {
-                "min": min(sqfts) if sqfts else 0,
-                "max": max(sqfts) if sqfts else 0,
-            },
-            "year_range": {
-                "min": min(years) if years else 0,
-                "max": max(years) if years else 0,
-            },
+            "price_range": ranges["price"],
+            "sqft_range": ranges["sqft"],
+            "year_range": ranges["year"],
             "defaults": {
                 "min_price": config.PRICE_RANGE[0],
                 "max_price": config.PRICE_RANGE[1],
@@ -204,11 +224,12 @@ def get_filters():
 
 
 @api.route("/stats", methods=["GET"])
+@cache.cached(timeout=600)
 def get_stats():
     """Get summary statistics about current listings."""
-    listings = database.get_all_listings()
+    stats = database.get_stats()
 
-    if not listings:
+    if not stats["total"]:
         return jsonify({
             "success": True,
             "stats": {
@@ -217,39 +238,28 @@ def get_stats():
             },
         })
 
-    # Calculate stats
-    prices = [l.price for l in listings if l.price]
-    scores = [l.value_score for l in listings if l.value_score]
-
-    # Count by city
-    cities = {}
-    for l in listings:
-        cities[l.city] = cities.get(l.city, 0) + 1
-
-    # Count features
-    with_pool = sum(1 for l in listings if l.has_pool)
-    with_yard = sum(1 for l in listings if l.has_yard)
-    with_solar = sum(1 for l in listings if l.has_solar)
+    # One aggregate scan plus one GROUP BY; no listings materialized here
+    cities = database.get_city_counts()
 
     return jsonify({
         "success": True,
         "stats": {
-            "total_listings": len(listings),
+            "total_listings": stats["total"],
             "price": {
-                "min": min(prices) if prices else 0,
-                "max": max(prices) if prices else 0,
-                "avg": round(sum(prices) / len(prices)) if prices else 0,
+                "min": stats["price_min"],
+                "max": stats["price_max"],
+                "avg": round(stats["price_avg"]),
             },
             "value_score": {
-                "min": min(scores) if scores else 0,
-                "max": max(scores) if scores else 0,
-                "avg": round(sum(scores) / len(scores), 1) if scores else 0,
+                "min": stats["score_min"],
+                "max": stats["score_max"],
+                "avg": round(stats["score_avg"], 1),
             },
             "by_city": cities,
             "features": {
-                "with_pool": with_pool,
-                "with_yard": with_yard,
-                "with_solar": with_solar,
+                "with_pool": stats["with_pool"],
+                "with_yard": stats["with_yard"],
+                "with_solar": stats["with_solar"],
             },
         },
     })
@@ -257,44 +267,43 @@ def get_stats():
 
 @api.route("/export", methods=["GET"])
 def export_csv():
-    """Export listings to CSV format."""
-    from flask import Response
+    """Export listings to CSV format, streamed row by row."""
+    from flask import Response, stream_with_context
     import csv
     import io
 
-    listings = database.get_all_listings()
-
-    # Sort by value score
-    listings.sort(key=lambda l: l.value_score or 0, reverse=True)
+    def generate():
+        # Reusable single-row buffer so memory stays flat regardless of
+        # listing count; sorting happens in SQL via iter_export_rows.
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
 
-    # Create CSV
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Header
-    writer.writerow([
-        "Address", "City", "Price", "Beds", "Baths", "SqFt", "Year Built",
-        "Lot SqFt", "HOA/Month", "Annual Tax", "Days on Market",
-        "Has Pool", "Has Yard", "Has Solar", "Crime Index",
-        "Distance to Downtown", "Nearest Downtown", "Value Score", "URL"
-    ])
-
-    # Data rows
-    for l in listings:
         writer.writerow([
-            l.address, l.city, l.price, l.beds, l.baths, l.sqft, l.year_built,
-            l.lot_sqft, l.hoa_monthly, l.annual_tax, l.days_on_market,
-            "Yes" if l.has_pool else "No",
-            "Yes" if l.has_yard else "No",
-            "Yes" if l.has_solar else "No",
-            l.crime_index, l.distance_to_downtown, l.nearest_downtown,
-            l.value_score, l.url
+            "Address", "City", "Price", "Beds", "Baths", "SqFt", "Year Built",
+            "Lot SqFt", "HOA/Month", "Annual Tax", "Days on Market",
+            "Has Pool", "Has Yard", "Has Solar", "Crime Index",
+            "Distance to Downtown", "Nearest Downtown", "Value Score", "URL"
         ])
-
-    output.seek(0)
+        yield buffer.getvalue()
+
+        for row in database.iter_export_rows():
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerow([
+                row["address"], row["city"], row["price"], row["beds"],
+                row["baths"], row["sqft"], row["year_built"],
+                row["lot_sqft"], row["hoa_monthly"], row["annual_tax"],
+                row["days_on_market"],
+                "Yes" if row["has_pool"] else "No",
+                "Yes" if row["has_yard"] else "No",
+                "Yes" if row["has_solar"] else "No",
+                row["crime_index"], row["distance_to_downtown"],
+                row["nearest_downtown"], row["value_score"], row["url"]
+            ])
+            yield buffer.getvalue()
 
     return Response(
-        output.getvalue(),
+        stream_with_context(generate()),
         mimetype="text/csv",
         headers={"Content-Disposition": "attachment; filename=listings.csv"}
     )
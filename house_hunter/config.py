@@ -1,5 +1,7 @@
 """Configuration settings for Arizona House Hunter."""
 
+from types import MappingProxyType
+
 # Search Parameters
 SEARCH_CITIES = {
     "phoenix_metro": ["Gilbert, AZ", "Chandler, AZ", "Scottsdale, AZ", "Mesa, AZ", "Surprise, AZ", "Paradise Valley, AZ"],
@@ -7,7 +9,7 @@ SEARCH_CITIES = {
 }
 
 # Redfin city/region IDs for API calls (correct Arizona region IDs)
-REDFIN_REGIONS = {
+REDFIN_REGIONS = MappingProxyType({
     "Gilbert": {"type": "city", "id": 6998, "state": "AZ"},
     "Chandler": {"type": "city", "id": 3104, "state": "AZ"},
     "Scottsdale": {"type": "city", "id": 16660, "state": "AZ"},
@@ -17,7 +19,7 @@ REDFIN_REGIONS = {
     "Oro Valley": {"type": "city", "id": 13300, "state": "AZ"},
     "Surprise": {"type": "city", "id": 18267, "state": "AZ"},
     "Paradise Valley": {"type": "city", "id": 13625, "state": "AZ"},
-}
+})
 
 # Price and property filters
 PRICE_RANGE = (400000, 700000)
@@ -27,10 +29,10 @@ MIN_BATHS = 2
 MIN_SQFT = 1200
 MAX_AGE_YEARS = 30
 MIN_YEAR_BUILT = 1996
-PROPERTY_TYPES = ["single_family", "townhouse"]
+PROPERTY_TYPES = ("single_family", "townhouse")
 
 # Downtown coordinates for distance calculations
-DOWNTOWN_COORDS = {
+DOWNTOWN_COORDS = MappingProxyType({
     "Phoenix": (33.4484, -112.0740),
     "Scottsdale": (33.4942, -111.9261),
     "Gilbert": (33.3528, -111.7890),
@@ -41,11 +43,11 @@ DOWNTOWN_COORDS = {
     "Oro Valley": (32.3909, -110.9665),
     "Surprise": (33.6306, -112.3332),
     "Paradise Valley": (33.5312, -111.9426),
-}
+})
 
 # City-level crime indices (higher = safer, scale 0-100)
 # Based on published crime statistics - relative safety scores
-CITY_CRIME_INDEX = {
+CITY_CRIME_INDEX = MappingProxyType({
     "Gilbert": 85,          # Very safe
     "Chandler": 78,         # Safe
     "Scottsdale": 75,       # Safe
@@ -59,10 +61,10 @@ CITY_CRIME_INDEX = {
     "Surprise": 80,         # Safe (growing retiree community)
     "Paradise Valley": 82,  # Very safe (affluent community)
     "Apache Junction": 50,  # Moderate
-}
+})
 
 # Scoring weights (must sum to 100)
-WEIGHTS = {
+WEIGHTS = MappingProxyType({
     "location": 25,        # Preferred cities
     "sqft_value": 23,      # Sq ft per dollar
     "year_built": 20,      # Newer is better
@@ -71,10 +73,10 @@ WEIGHTS = {
     "days_on_market": 3,   # Potential deal indicator
     "pool": 3,             # Nice to have
     "solar": 3,            # Nice to have
-}
+})
 
 # Location preference weights (0-1 scale, higher = more preferred)
-LOCATION_WEIGHTS = {
+LOCATION_WEIGHTS = MappingProxyType({
     "Scottsdale": 1.00,       # Family proximity + top retiree amenities
     "Paradise Valley": 0.98,  # Exclusive enclave, adjacent to Scottsdale
     "Gilbert": 0.97,          # #2 US News AZ retire, top safety/value
@@ -88,10 +90,13 @@ LOCATION_WEIGHTS = {
     "Apache Junction": 0.77,  # Budget retiree value
     "Vail": 0.75,             # Quiet safety
     "Tucson": 0.72,           # Amenities but urban crime
-}
+})
 
 # Scraping settings
-REQUEST_DELAY_SECONDS = 2.5  # Delay between requests to avoid blocks
+# Backoff base for retrying throttled/failed requests (the fetcher
+# retries after delay, 2x delay, 4x delay); the old between-request
+# sleep went away with the concurrent city fetches
+REQUEST_DELAY_SECONDS = 2.5
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 
 # Database settings
@@ -99,7 +104,10 @@ USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTM
 import os
 import tempfile
 
-if os.environ.get("STREAMLIT_SERVER_HEADLESS"):
+if os.environ.get("HOUSE_HUNTER_DB"):
+    # Explicit override (used by the test suite for throwaway databases)
+    DATABASE_PATH = os.environ["HOUSE_HUNTER_DB"]
+elif os.environ.get("STREAMLIT_SERVER_HEADLESS"):
     # Running on Streamlit Cloud - use temp directory
     DATABASE_PATH = os.path.join(tempfile.gettempdir(), "listings.db")
 else:
@@ -109,4 +117,5 @@ else:
 # Flask settings
 FLASK_HOST = "0.0.0.0"
 FLASK_PORT = 5000
-FLASK_DEBUG = True
+# Debug defaults on for local development; set FLASK_DEBUG=0 in production
+FLASK_DEBUG = os.environ.get("FLASK_DEBUG", "1") == "1"
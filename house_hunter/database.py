@@ -2,6 +2,7 @@
 
 import sqlite3
 import json
+import logging
 from pathlib import Path
 from typing import List, Optional
 from datetime import datetime
@@ -9,6 +10,8 @@ from datetime import datetime
 from .models import Listing
 from . import config
 
+logger = logging.getLogger(__name__)
+
 
 def get_db_path() -> Path:
     """Get the database file path, creating directory if needed."""
@@ -17,13 +20,66 @@ def get_db_path() -> Path:
     return db_path
 
 
+def _apply_pragmas(conn: sqlite3.Connection):
+    """Tune SQLite for fewer fsyncs and syscall-free reads.
+
+    WAL + synchronous=NORMAL lets readers run during /refresh writes and
+    cuts the per-commit fsync cost; mmap serves reads from the page
+    cache without read() syscalls.
+    """
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    conn.execute("PRAGMA cache_size=-65536")    # 64 MB
+
+
+class _RequestConnection(sqlite3.Connection):
+    """Connection shared for the lifetime of a Flask request.
+
+    close() is a no-op so the helpers in this module can keep their
+    usual connect/close pattern; the real close happens in the app's
+    teardown handler via close_request_connection().
+    """
+
+    def close(self):
+        pass
+
+
 def get_connection() -> sqlite3.Connection:
-    """Get a database connection with row factory."""
+    """Get a database connection with row factory.
+
+    Inside a Flask app context the same connection is reused for the
+    whole request instead of opening and closing one per call.
+    """
+    try:
+        from flask import g, has_app_context
+    except ImportError:
+        has_app_context = None
+
+    if has_app_context is not None and has_app_context():
+        if "db_conn" not in g:
+            conn = sqlite3.connect(get_db_path(), factory=_RequestConnection)
+            conn.row_factory = sqlite3.Row
+            _apply_pragmas(conn)
+            g.db_conn = conn
+        return g.db_conn
+
     conn = sqlite3.connect(get_db_path())
     conn.row_factory = sqlite3.Row
+    _apply_pragmas(conn)
     return conn
 
 
+def close_request_connection(exception=None):
+    """Close the request-scoped connection; wired to teardown_appcontext."""
+    from flask import g
+
+    conn = g.pop("db_conn", None)
+    if conn is not None:
+        sqlite3.Connection.close(conn)
+
+
 def init_database():
     """Initialize the database schema."""
     conn = get_connection()
@@ -96,6 +152,21 @@ def init_database():
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_listings_price ON listings(price)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_listings_value_score ON listings(value_score)")
 
+    # Composite indexes matching the API's filter+sort shapes, so
+    # filtered queries seek instead of scanning the whole table
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_listings_city_score "
+        "ON listings(city, value_score DESC)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_listings_price_score "
+        "ON listings(price, value_score DESC)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_listings_beds_baths_sqft "
+        "ON listings(beds, baths, sqft)"
+    )
+
     # Migration: Add stories column if it doesn't exist
     cursor.execute("PRAGMA table_info(listings)")
     columns = [row[1] for row in cursor.fetchall()]
@@ -106,22 +177,22 @@ def init_database():
     conn.close()
 
 
-def save_listing(listing: Listing):
-    """Save or update a single listing."""
-    conn = get_connection()
-    cursor = conn.cursor()
+_INSERT_LISTING_SQL = """
+    INSERT OR REPLACE INTO listings (
+        id, source, url, address, city, state, zip_code,
+        latitude, longitude, price, beds, baths, sqft, lot_sqft,
+        year_built, property_type, stories, hoa_monthly, annual_tax,
+        days_on_market, list_date, has_pool, has_yard, has_solar,
+        has_garage, has_basement, garage_spaces, walk_score,
+        crime_index, distance_to_downtown, nearest_downtown,
+        value_score, last_updated, photo_url, description
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
 
-    cursor.execute("""
-        INSERT OR REPLACE INTO listings (
-            id, source, url, address, city, state, zip_code,
-            latitude, longitude, price, beds, baths, sqft, lot_sqft,
-            year_built, property_type, stories, hoa_monthly, annual_tax,
-            days_on_market, list_date, has_pool, has_yard, has_solar,
-            has_garage, has_basement, garage_spaces, walk_score,
-            crime_index, distance_to_downtown, nearest_downtown,
-            value_score, last_updated, photo_url, description
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
+
+def _listing_to_row(listing: Listing) -> tuple:
+    """Convert a Listing to a parameter tuple for the insert statement."""
+    return (
         listing.id, listing.source, listing.url, listing.address,
         listing.city, listing.state, listing.zip_code, listing.latitude,
         listing.longitude, listing.price, listing.beds, listing.baths,
@@ -133,16 +204,50 @@ def save_listing(listing: Listing):
         listing.crime_index, listing.distance_to_downtown,
         listing.nearest_downtown, listing.value_score, listing.last_updated,
         listing.photo_url, listing.description
-    ))
+    )
+
+
+def save_listing(listing: Listing, cursor: Optional[sqlite3.Cursor] = None):
+    """Save or update a single listing.
 
+    If a cursor is provided, the caller owns the transaction.
+    """
+    if cursor is not None:
+        cursor.execute(_INSERT_LISTING_SQL, _listing_to_row(listing))
+        return
+
+    conn = get_connection()
+    conn.execute(_INSERT_LISTING_SQL, _listing_to_row(listing))
     conn.commit()
     conn.close()
 
 
 def save_listings(listings: List[Listing]):
-    """Save multiple listings in a batch."""
-    for listing in listings:
-        save_listing(listing)
+    """Save multiple listings in a single transaction."""
+    if not listings:
+        return
+
+    conn = get_connection()
+    conn.executemany(_INSERT_LISTING_SQL, [_listing_to_row(l) for l in listings])
+    conn.commit()
+    # Refresh planner statistics so the new rows use the right indexes
+    conn.execute("ANALYZE")
+    conn.close()
+
+
+def replace_all_listings(listings: List[Listing]):
+    """Atomically swap the stored listings for a freshly fetched set.
+
+    The delete and bulk insert share one transaction (one fsync), so
+    with WAL enabled concurrent readers see either the old snapshot or
+    the new one — never an empty or half-written table.
+    """
+    conn = get_connection()
+    with conn:
+        conn.execute("DELETE FROM listings")
+        conn.executemany(_INSERT_LISTING_SQL, [_listing_to_row(l) for l in listings])
+    conn.execute("ANALYZE")
+    conn.close()
 
 
 def get_all_listings() -> List[Listing]:
@@ -150,14 +255,55 @@ def get_all_listings() -> List[Listing]:
     conn = get_connection()
     cursor = conn.cursor()
 
-    cursor.execute("SELECT * FROM listings")
+    cursor.execute(_SELECT_ALL_SQL)
     rows = cursor.fetchall()
     conn.close()
 
     return [_row_to_listing(row) for row in rows]
 
 
-def get_filtered_listings(
+# All columns of the listings table, used to validate narrow selects
+LISTING_COLUMNS = (
+    "id", "source", "url", "address", "city", "state", "zip_code",
+    "latitude", "longitude", "price", "beds", "baths", "sqft", "lot_sqft",
+    "year_built", "property_type", "stories", "hoa_monthly", "annual_tax",
+    "days_on_market", "list_date", "has_pool", "has_yard", "has_solar",
+    "has_garage", "has_basement", "garage_spaces", "walk_score",
+    "crime_index", "distance_to_downtown", "nearest_downtown",
+    "value_score", "last_updated", "photo_url", "description",
+)
+
+# Full-row select with the columns spelled out. SELECT * returns table
+# order, and migrated databases have ALTER TABLE'd columns (stories)
+# appended at the end rather than in declaration order - the positional
+# hydration in _row_to_listing needs the explicit list to be safe on
+# both fresh and migrated schemas.
+_SELECT_ALL_SQL = f"SELECT {', '.join(LISTING_COLUMNS)} FROM listings"
+
+# Columns the API is allowed to sort by (guards against SQL injection)
+SORTABLE_COLUMNS = frozenset({
+    "value_score", "price", "beds", "baths", "sqft", "year_built",
+    "hoa_monthly", "days_on_market", "distance_to_downtown", "crime_index",
+})
+
+# Stable filter clause using nullable named params: inactive filters
+# collapse to TRUE, so the SQL text (and SQLite's cached statement plan)
+# stays the same no matter which filters are active. Only the city list
+# and the ORDER BY column vary, each over a small set of shapes.
+_FILTERED_LISTINGS_WHERE = """
+    WHERE (:min_price IS NULL OR price >= :min_price)
+      AND (:max_price IS NULL OR price <= :max_price)
+      AND (:min_beds IS NULL OR beds >= :min_beds)
+      AND (:min_baths IS NULL OR baths >= :min_baths)
+      AND (:min_sqft IS NULL OR sqft >= :min_sqft)
+      AND (:has_yard IS NULL OR has_yard = :has_yard)
+      AND (:has_pool IS NULL OR has_pool = :has_pool)
+      AND (:has_solar IS NULL OR has_solar = :has_solar)
+      AND (:min_year IS NULL OR year_built >= :min_year)
+"""
+
+
+def get_filtered_rows(
     min_price: Optional[int] = None,
     max_price: Optional[int] = None,
     min_beds: Optional[int] = None,
@@ -168,69 +314,98 @@ def get_filtered_listings(
     has_pool: Optional[bool] = None,
     has_solar: Optional[bool] = None,
     max_age: Optional[int] = None,
-) -> List[Listing]:
-    """Retrieve listings with optional filters applied."""
+    sort_by: Optional[str] = None,
+    sort_dir: str = "desc",
+    limit: Optional[int] = None,
+    offset: int = 0,
+    columns: Optional[List[str]] = None,
+) -> List[sqlite3.Row]:
+    """Retrieve filtered listing rows, optionally selecting only some columns.
+
+    Filtering, sorting, and pagination all run in SQL so SQLite's
+    indexes do the work instead of materializing every row first.
+    Callers that don't need full Listing objects can pass a narrow
+    column list and serialize the rows directly.
+    """
     conn = get_connection()
-    cursor = conn.cursor()
-
-    query = "SELECT * FROM listings WHERE 1=1"
-    params = []
-
-    if min_price is not None:
-        query += " AND price >= ?"
-        params.append(min_price)
-
-    if max_price is not None:
-        query += " AND price <= ?"
-        params.append(max_price)
 
-    if min_beds is not None:
-        query += " AND beds >= ?"
-        params.append(min_beds)
-
-    if min_baths is not None:
-        query += " AND baths >= ?"
-        params.append(min_baths)
-
-    if min_sqft is not None:
-        query += " AND sqft >= ?"
-        params.append(min_sqft)
+    select = "*"
+    if columns:
+        invalid = set(columns) - set(LISTING_COLUMNS)
+        if invalid:
+            raise ValueError(f"Unknown listing columns: {sorted(invalid)}")
+        select = ", ".join(columns)
+
+    query = f"SELECT {select} FROM listings" + _FILTERED_LISTINGS_WHERE
+    params = {
+        "min_price": min_price,
+        "max_price": max_price,
+        "min_beds": min_beds,
+        "min_baths": min_baths,
+        "min_sqft": min_sqft,
+        "has_yard": None if has_yard is None else int(has_yard),
+        "has_pool": None if has_pool is None else int(has_pool),
+        "has_solar": None if has_solar is None else int(has_solar),
+        "min_year": None if max_age is None else datetime.now().year - max_age,
+    }
 
     if cities:
-        placeholders = ",".join("?" * len(cities))
+        placeholders = ",".join(f":city{i}" for i in range(len(cities)))
         query += f" AND city IN ({placeholders})"
-        params.extend(cities)
-
-    if has_yard is not None:
-        query += " AND has_yard = ?"
-        params.append(1 if has_yard else 0)
-
-    if has_pool is not None:
-        query += " AND has_pool = ?"
-        params.append(1 if has_pool else 0)
+        params.update({f"city{i}": c for i, c in enumerate(cities)})
 
-    if has_solar is not None:
-        query += " AND has_solar = ?"
-        params.append(1 if has_solar else 0)
+    if sort_by:
+        if sort_by in SORTABLE_COLUMNS:
+            direction = "ASC" if sort_dir.lower() == "asc" else "DESC"
+            query += f" ORDER BY {sort_by} {direction} NULLS LAST"
+        else:
+            logger.warning(f"Ignoring invalid sort field: {sort_by}")
 
-    if max_age is not None:
-        min_year = datetime.now().year - max_age
-        query += " AND year_built >= ?"
-        params.append(min_year)
+    # LIMIT -1 means "no limit" in SQLite, keeping the statement stable
+    query += " LIMIT :limit OFFSET :offset"
+    params["limit"] = -1 if limit is None else limit
+    params["offset"] = offset
 
-    cursor.execute(query, params)
+    cursor = conn.execute(query, params)
     rows = cursor.fetchall()
     conn.close()
 
+    return rows
+
+
+def get_filtered_listings(**kwargs) -> List[Listing]:
+    """Retrieve filtered listings as Listing objects.
+
+    Accepts the same keyword arguments as get_filtered_rows (except
+    `columns`: hydration needs every field, in LISTING_COLUMNS order).
+    """
+    rows = get_filtered_rows(columns=list(LISTING_COLUMNS), **kwargs)
     return [_row_to_listing(row) for row in rows]
 
 
+def iter_export_rows():
+    """Yield listing rows for CSV export, sorted by value score in SQL."""
+    conn = get_connection()
+    try:
+        cursor = conn.execute("""
+            SELECT address, city, price, beds, baths, sqft, year_built,
+                   lot_sqft, hoa_monthly, annual_tax, days_on_market,
+                   has_pool, has_yard, has_solar, crime_index,
+                   distance_to_downtown, nearest_downtown, value_score, url
+            FROM listings
+            ORDER BY value_score DESC NULLS LAST
+        """)
+        yield from cursor
+    finally:
+        conn.close()
+
+
 def get_listing_by_id(listing_id: str) -> Optional[Listing]:
     """Retrieve a single listing by ID."""
     conn = get_connection()
     cursor = conn.cursor()
 
-    cursor.execute("SELECT * FROM listings WHERE id = ?", (listing_id,))
+    cursor.execute(_SELECT_ALL_SQL + " WHERE id = ?", (listing_id,))
     row = cursor.fetchone()
     conn.close()
 
@@ -246,6 +421,141 @@ def delete_all_listings():
     conn.close()
 
 
+def get_stats() -> dict:
+    """Get all summary aggregates for the stats endpoint in one SQL pass.
+
+    Counts, price/score ranges, and feature tallies come from a single
+    sequential scan in SQLite rather than repeated Python passes.
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    cursor.execute("""
+        SELECT
+            COUNT(*) AS total,
+            MIN(NULLIF(price, 0)) AS price_min,
+            MAX(NULLIF(price, 0)) AS price_max,
+            AVG(NULLIF(price, 0)) AS price_avg,
+            MIN(NULLIF(value_score, 0)) AS score_min,
+            MAX(NULLIF(value_score, 0)) AS score_max,
+            AVG(NULLIF(value_score, 0)) AS score_avg,
+            COALESCE(SUM(has_pool), 0) AS with_pool,
+            COALESCE(SUM(has_yard), 0) AS with_yard,
+            COALESCE(SUM(has_solar), 0) AS with_solar
+        FROM listings
+    """)
+    row = cursor.fetchone()
+    conn.close()
+
+    return {
+        "total": row["total"],
+        "price_min": row["price_min"] or 0,
+        "price_max": row["price_max"] or 0,
+        "price_avg": row["price_avg"] or 0,
+        "score_min": row["score_min"] or 0,
+        "score_max": row["score_max"] or 0,
+        "score_avg": row["score_avg"] or 0,
+        "with_pool": row["with_pool"],
+        "with_yard": row["with_yard"],
+        "with_solar": row["with_solar"],
+    }
+
+
+def get_city_counts() -> dict:
+    """Count listings per city via GROUP BY."""
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    cursor.execute(
+        "SELECT city, COUNT(*) AS n FROM listings GROUP BY city ORDER BY n DESC"
+    )
+    counts = {row["city"]: row["n"] for row in cursor.fetchall()}
+    conn.close()
+
+    return counts
+
+
+def get_normalization_stats() -> dict:
+    """Get min/max ranges for the features used in score normalization.
+
+    Computed with SQL aggregates so score breakdowns don't need to
+    materialize the whole table for context. Keys map to (min, max)
+    tuples, or None when no listing has the feature.
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    cursor.execute("""
+        SELECT
+            MIN(CASE WHEN price > 0 AND sqft > 0
+                THEN CAST(sqft AS REAL) / price END) AS spd_min,
+            MAX(CASE WHEN price > 0 AND sqft > 0
+                THEN CAST(sqft AS REAL) / price END) AS spd_max,
+            MIN(NULLIF(year_built, 0)) AS year_min,
+            MAX(NULLIF(year_built, 0)) AS year_max,
+            MIN(hoa_monthly) AS hoa_min,
+            MAX(hoa_monthly) AS hoa_max,
+            MIN(days_on_market) AS dom_min,
+            MAX(days_on_market) AS dom_max
+        FROM listings
+    """)
+    row = cursor.fetchone()
+    conn.close()
+
+    def _pair(lo, hi):
+        return (lo, hi) if lo is not None and hi is not None else None
+
+    return {
+        "sqft_per_dollar": _pair(row["spd_min"], row["spd_max"]),
+        "year_built": _pair(row["year_min"], row["year_max"]),
+        "hoa_monthly": _pair(row["hoa_min"], row["hoa_max"]),
+        "days_on_market": _pair(row["dom_min"], row["dom_max"]),
+    }
+
+
+def list_distinct(column: str) -> List[str]:
+    """List distinct non-empty values of a listings column, sorted."""
+    if column not in LISTING_COLUMNS:
+        raise ValueError(f"Unknown listing column: {column}")
+
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    cursor.execute(
+        f"SELECT DISTINCT {column} FROM listings"
+        f" WHERE {column} IS NOT NULL AND {column} != '' ORDER BY {column}"
+    )
+    values = [row[0] for row in cursor.fetchall()]
+    conn.close()
+
+    return values
+
+
+def get_filter_ranges() -> dict:
+    """Get min/max ranges for price, sqft, and year built in one query."""
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    cursor.execute("""
+        SELECT
+            MIN(NULLIF(price, 0)) AS price_min,
+            MAX(NULLIF(price, 0)) AS price_max,
+            MIN(NULLIF(sqft, 0)) AS sqft_min,
+            MAX(NULLIF(sqft, 0)) AS sqft_max,
+            MIN(NULLIF(year_built, 0)) AS year_min,
+            MAX(NULLIF(year_built, 0)) AS year_max
+        FROM listings
+    """)
+    row = cursor.fetchone()
+    conn.close()
+
+    return {
+        "price": {"min": row["price_min"] or 0, "max": row["price_max"] or 0},
+        "sqft": {"min": row["sqft_min"] or 0, "max": row["sqft_max"] or 0},
+        "year": {"min": row["year_min"] or 0, "max": row["year_max"] or 0},
+    }
+
+
 def get_listing_count() -> int:
     """Get total number of listings in database."""
     conn = get_connection()
@@ -288,6 +598,61 @@ def get_enrichment_cache(address: str) -> Optional[dict]:
     return None
 
 
+# SQLite's default variable limit is 999; stay safely under it
+_IN_CLAUSE_CHUNK = 500
+
+
+def get_enrichment_cache_many(addresses: List[str]) -> dict:
+    """Get cached enrichment data for many addresses in one pass.
+
+    Returns {address: {"walk_score", "latitude", "longitude"}} for the
+    addresses that have cache entries, querying in chunks instead of
+    one SELECT per address.
+    """
+    if not addresses:
+        return {}
+
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    cached = {}
+    for start in range(0, len(addresses), _IN_CLAUSE_CHUNK):
+        chunk = addresses[start:start + _IN_CLAUSE_CHUNK]
+        placeholders = ",".join("?" * len(chunk))
+        cursor.execute(
+            f"SELECT * FROM enrichment_cache WHERE address IN ({placeholders})",
+            chunk,
+        )
+        for row in cursor.fetchall():
+            cached[row["address"]] = {
+                "walk_score": row["walk_score"],
+                "latitude": row["latitude"],
+                "longitude": row["longitude"],
+            }
+
+    conn.close()
+    return cached
+
+
+def save_enrichment_cache_many(entries: List[tuple]):
+    """Cache enrichment data for many addresses in one transaction.
+
+    Each entry is an (address, walk_score, latitude, longitude) tuple.
+    """
+    if not entries:
+        return
+
+    cached_at = datetime.now().isoformat()
+    conn = get_connection()
+    conn.executemany("""
+        INSERT OR REPLACE INTO enrichment_cache (address, walk_score, latitude, longitude, cached_at)
+        VALUES (?, ?, ?, ?, ?)
+    """, [(address, walk_score, lat, lon, cached_at)
+          for address, walk_score, lat, lon in entries])
+    conn.commit()
+    conn.close()
+
+
 def log_search(params: dict, results_count: int):
     """Log a search to history."""
     conn = get_connection()
@@ -303,41 +668,58 @@ def log_search(params: dict, results_count: int):
 
 
 def _row_to_listing(row: sqlite3.Row) -> Listing:
-    """Convert a database row to a Listing object."""
+    """Convert a full database row to a Listing object.
+
+    The row must carry every column in LISTING_COLUMNS order; the
+    hydrating queries guarantee that by selecting through
+    _SELECT_ALL_SQL (or an explicit column list) rather than SELECT *,
+    whose order drifts on databases migrated with ALTER TABLE.
+    Unpacking positionally and constructing positionally skips the 35
+    string-keyed Row lookups and the kwargs dict the old keyword form
+    paid per row - this runs once per listing on every cold load.
+    """
+    (listing_id, source, url, address, city, state, zip_code,
+     latitude, longitude, price, beds, baths, sqft, lot_sqft,
+     year_built, property_type, stories, hoa_monthly, annual_tax,
+     days_on_market, list_date, has_pool, has_yard, has_solar,
+     has_garage, has_basement, garage_spaces, walk_score,
+     crime_index, distance_to_downtown, nearest_downtown,
+     value_score, last_updated, photo_url, description) = row
+
     return Listing(
-        id=row["id"],
-        source=row["source"],
-        url=row["url"] or "",
-        address=row["address"],
-        city=row["city"],
-        state=row["state"] or "AZ",
-        zip_code=row["zip_code"] or "",
-        latitude=row["latitude"],
-        longitude=row["longitude"],
-        price=row["price"] or 0,
-        beds=row["beds"] or 0,
-        baths=row["baths"] or 0.0,
-        sqft=row["sqft"] or 0,
-        lot_sqft=row["lot_sqft"],
-        year_built=row["year_built"],
-        property_type=row["property_type"] or "",
-        stories=row["stories"],
-        hoa_monthly=row["hoa_monthly"],
-        annual_tax=row["annual_tax"],
-        days_on_market=row["days_on_market"],
-        list_date=row["list_date"],
-        has_pool=bool(row["has_pool"]),
-        has_yard=bool(row["has_yard"]),
-        has_solar=bool(row["has_solar"]),
-        has_garage=bool(row["has_garage"]),
-        has_basement=bool(row["has_basement"]),
-        garage_spaces=row["garage_spaces"] or 0,
-        walk_score=row["walk_score"],
-        crime_index=row["crime_index"],
-        distance_to_downtown=row["distance_to_downtown"],
-        nearest_downtown=row["nearest_downtown"],
-        value_score=row["value_score"],
-        last_updated=row["last_updated"] or "",
-        photo_url=row["photo_url"],
-        description=row["description"],
+        listing_id,
+        source,
+        url or "",
+        address,
+        city,
+        state or "AZ",
+        zip_code or "",
+        latitude,
+        longitude,
+        price or 0,
+        beds or 0,
+        baths or 0.0,
+        sqft or 0,
+        lot_sqft,
+        year_built,
+        property_type or "",
+        stories,
+        hoa_monthly,
+        annual_tax,
+        days_on_market,
+        list_date,
+        bool(has_pool),
+        bool(has_yard),
+        bool(has_solar),
+        bool(has_garage),
+        bool(has_basement),
+        garage_spaces or 0,
+        walk_score,
+        crime_index,
+        distance_to_downtown,
+        nearest_downtown,
+        value_score,
+        last_updated or "",
+        photo_url,
+        description,
     )
@@ -1,11 +1,15 @@
 """Data enrichment module for adding walk scores, crime data, and distance calculations."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Optional, Tuple
-from math import radians, sin, cos, sqrt, atan2
+from math import asin, radians, sin, cos, sqrt
 
+import numpy as np
 from geopy.geocoders import Nominatim
 from geopy.exc import GeocoderTimedOut, GeocoderServiceError
+from geopy.extra.rate_limiter import RateLimiter
 
 from .models import Listing
 from . import config
@@ -14,12 +18,40 @@ from . import database
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Downtown coordinates pre-converted to radians once at import, so the
+# batch Haversine below is pure ufunc work with no per-call conversion
+_DOWNTOWN_NAMES = tuple(config.DOWNTOWN_COORDS.keys())
+_DOWNTOWN_RAD = np.radians(
+    np.array(list(config.DOWNTOWN_COORDS.values()), dtype=np.float64)
+)
+
+_EARTH_RADIUS_MILES = 3959
+
+# Scalar-path twin of _DOWNTOWN_RAD: per-downtown radians and cos(lat)
+# cached once, so get_nearest_downtown only converts the query point
+_DOWNTOWN_PRECOMP = [
+    (name, radians(lat), radians(lon), cos(radians(lat)))
+    for name, (lat, lon) in config.DOWNTOWN_COORDS.items()
+]
+
 
 class GeoEnricher:
     """Handles geocoding and distance calculations."""
 
+    # Nominatim's usage policy caps us at 1 request/second, so more
+    # geocoding workers buy nothing; raise this for a paid geocoder
+    GEOCODE_WORKERS = 1
+
     def __init__(self):
         self.geocoder = Nominatim(user_agent="arizona_house_hunter_v1")
+        # The limiter enforces the 1 QPS policy (with retry backoff) no
+        # matter how many worker threads feed it; cache hits never reach it
+        self._rate_limited_geocode = RateLimiter(
+            self.geocoder.geocode,
+            min_delay_seconds=1,
+            max_retries=2,
+            error_wait_seconds=5,
+        )
 
     def geocode_address(self, address: str, city: str, state: str = "AZ") -> Optional[Tuple[float, float]]:
         """
@@ -32,13 +64,18 @@ class GeoEnricher:
         if cached and cached.get("latitude") and cached.get("longitude"):
             return (cached["latitude"], cached["longitude"])
 
+        coords = self._geocode_remote(full_address)
+        if coords:
+            # Cache the result
+            database.save_enrichment_cache(full_address, None, coords[0], coords[1])
+        return coords
+
+    def _geocode_remote(self, full_address: str) -> Optional[Tuple[float, float]]:
+        """Geocode through the rate-limited service, without cache I/O."""
         try:
-            location = self.geocoder.geocode(full_address, timeout=10)
+            location = self._rate_limited_geocode(full_address, timeout=10)
             if location:
-                lat, lon = location.latitude, location.longitude
-                # Cache the result
-                database.save_enrichment_cache(full_address, None, lat, lon)
-                return (lat, lon)
+                return (location.latitude, location.longitude)
         except (GeocoderTimedOut, GeocoderServiceError) as e:
             logger.warning(f"Geocoding failed for {full_address}: {e}")
 
@@ -50,18 +87,21 @@ class GeoEnricher:
         """
         Calculate distance between two points using Haversine formula.
         Returns distance in miles.
-        """
-        R = 3959  # Earth's radius in miles
 
+        Scalar convenience path; bulk callers should use
+        get_nearest_downtown_batch, which runs the same formula
+        vectorized over the whole batch.
+        """
         lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
 
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
+        # asin form of the angle: same result as atan2(sqrt(a),
+        # sqrt(1-a)) for a in [0, 1] but one sqrt and one transcendental
+        # call cheaper — four trig calls, one sqrt, one asin in total
+        s1 = sin((lat2 - lat1) * 0.5)
+        s2 = sin((lon2 - lon1) * 0.5)
+        a = s1 * s1 + cos(lat1) * cos(lat2) * s2 * s2
 
-        a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
-        c = 2 * atan2(sqrt(a), sqrt(1 - a))
-
-        return R * c
+        return 2 * _EARTH_RADIUS_MILES * asin(sqrt(a))
 
     def get_nearest_downtown(
         self, lat: float, lon: float
@@ -69,32 +109,86 @@ class GeoEnricher:
         """
         Find the nearest downtown and return its name and distance.
         Returns (downtown_name, distance_in_miles).
+
+        Works from the precomputed downtown trig: only the query point
+        is converted to radians, and since the Haversine is monotonic
+        in its `a` term, the winner is picked on `a` alone and only
+        that one converted to miles.
         """
-        nearest = None
-        min_distance = float("inf")
+        lat1 = radians(lat)
+        lon1 = radians(lon)
+        cos_lat1 = cos(lat1)
 
-        for downtown, (d_lat, d_lon) in config.DOWNTOWN_COORDS.items():
-            distance = self.calculate_distance(lat, lon, d_lat, d_lon)
-            if distance < min_distance:
-                min_distance = distance
+        nearest = None
+        min_a = float("inf")
+
+        for downtown, d_lat, d_lon, cos_d_lat in _DOWNTOWN_PRECOMP:
+            s1 = sin((d_lat - lat1) * 0.5)
+            s2 = sin((d_lon - lon1) * 0.5)
+            a = s1 * s1 + cos_lat1 * cos_d_lat * s2 * s2
+            if a < min_a:
+                min_a = a
                 nearest = downtown
 
-        return (nearest or "Unknown", round(min_distance, 1))
+        if nearest is None:
+            return ("Unknown", round(float("inf"), 1))
+
+        distance = 2 * _EARTH_RADIUS_MILES * asin(sqrt(min_a))
+        return (nearest, round(distance, 1))
+
+    def get_nearest_downtown_batch(
+        self, lats: List[float], lons: List[float]
+    ) -> List[Tuple[str, float]]:
+        """
+        Vectorized nearest-downtown lookup for many coordinates at once.
+        One NumPy Haversine over the listings x downtowns grid replaces
+        a Python trig call per pair.
+        Returns a list of (downtown_name, distance_in_miles) per input.
+        """
+        lat1 = np.radians(np.asarray(lats, dtype=np.float64))[:, None]
+        lon1 = np.radians(np.asarray(lons, dtype=np.float64))[:, None]
+
+        dlat = _DOWNTOWN_RAD[None, :, 0] - lat1
+        dlon = _DOWNTOWN_RAD[None, :, 1] - lon1
+
+        a = (
+            np.sin(dlat / 2) ** 2
+            + np.cos(lat1) * np.cos(_DOWNTOWN_RAD[None, :, 0]) * np.sin(dlon / 2) ** 2
+        )
+        distances = 2 * _EARTH_RADIUS_MILES * np.arcsin(np.sqrt(a))
+
+        nearest = distances.argmin(axis=1)
+        return [
+            (_DOWNTOWN_NAMES[idx], round(float(distances[i, idx]), 1))
+            for i, idx in enumerate(nearest)
+        ]
 
 
+# Crime indices re-keyed by casefolded name once at import, so the
+# common lookup is a single dict probe with no title-casing
+_CRIME_INDEX_BY_CASEFOLD = {
+    name.casefold(): index for name, index in config.CITY_CRIME_INDEX.items()
+}
+
+
+@lru_cache(maxsize=256)
 def get_crime_index(city: str) -> int:
     """
     Get the crime safety index for a city.
     Higher values = safer (scale 0-100).
+
+    Cached: the handful of distinct city spellings repeat across every
+    listing, so even the miss path runs once per spelling.
     """
-    # Normalize city name for lookup
-    city_normalized = city.strip().title()
+    index = _CRIME_INDEX_BY_CASEFOLD.get(city.strip().casefold())
+    if index is not None:
+        return index
 
-    # Handle variations
-    if "Green Valley" in city_normalized:
-        city_normalized = "Green Valley"
+    # Slow path for variant spellings like "Green Valley North"
+    if "green valley" in city.casefold():
+        return config.CITY_CRIME_INDEX["Green Valley"]
 
-    return config.CITY_CRIME_INDEX.get(city_normalized, 50)  # Default to 50 if unknown
+    return 50  # Default for unknown cities
 
 
 def enrich_listing(listing: Listing, geo_enricher: Optional[GeoEnricher] = None) -> Listing:
@@ -122,10 +216,9 @@ def enrich_listing(listing: Listing, geo_enricher: Optional[GeoEnricher] = None)
         listing.nearest_downtown = nearest
         listing.distance_to_downtown = distance
 
-    # Try to infer yard from lot size if not already set
-    if not listing.has_yard and listing.lot_sqft:
-        # Properties with lot > 3000 sqft likely have a yard
-        listing.has_yard = listing.lot_sqft > 3000
+    # Infer yard from lot size (> 3000 sqft likely has one); single
+    # boolean expression, no branch in the per-listing loop
+    listing.has_yard = listing.has_yard or (listing.lot_sqft or 0) > 3000
 
     return listing
 
@@ -141,8 +234,13 @@ def enrich_all_listings(listings: List[Listing]) -> List[Listing]:
     enriched = []
     for i, listing in enumerate(listings):
         try:
-            enriched_listing = enrich_listing(listing, geo_enricher)
-            enriched.append(enriched_listing)
+            # Per-listing steps minus geocoding and downtown distance,
+            # which run as batches over the whole set below
+            listing.crime_index = get_crime_index(listing.city)
+
+            listing.has_yard = listing.has_yard or (listing.lot_sqft or 0) > 3000
+
+            enriched.append(listing)
 
             if (i + 1) % 10 == 0:
                 logger.info(f"Enriched {i + 1}/{len(listings)} listings")
@@ -151,5 +249,51 @@ def enrich_all_listings(listings: List[Listing]) -> List[Listing]:
             logger.warning(f"Failed to enrich listing {listing.id}: {e}")
             enriched.append(listing)  # Keep original if enrichment fails
 
+    # Geocode the listings still missing coordinates. One bulk SELECT
+    # primes the cache for every candidate address, so cache hits are
+    # dict lookups; only true misses go through the rate-limited pool,
+    # and their results are written back in one transaction at the end.
+    missing = [l for l in enriched if not l.latitude or not l.longitude]
+    if missing:
+        addresses = [f"{l.address}, {l.city}, AZ" for l in missing]
+        cache_map = database.get_enrichment_cache_many(addresses)
+        new_entries = []
+
+        def _geocode(item):
+            listing, full_address = item
+            cached = cache_map.get(full_address)
+            if cached and cached.get("latitude") and cached.get("longitude"):
+                return (cached["latitude"], cached["longitude"])
+
+            try:
+                coords = geo_enricher._geocode_remote(full_address)
+            except Exception as e:
+                logger.warning(f"Failed to geocode listing {listing.id}: {e}")
+                return None
+
+            if coords:
+                new_entries.append((full_address, None, coords[0], coords[1]))
+            return coords
+
+        with ThreadPoolExecutor(max_workers=GeoEnricher.GEOCODE_WORKERS) as executor:
+            for listing, coords in zip(
+                missing, executor.map(_geocode, zip(missing, addresses))
+            ):
+                if coords:
+                    listing.latitude, listing.longitude = coords
+
+        database.save_enrichment_cache_many(new_entries)
+
+    # Batch the downtown distances for every listing with coordinates
+    with_coords = [l for l in enriched if l.latitude and l.longitude]
+    if with_coords:
+        results = geo_enricher.get_nearest_downtown_batch(
+            [l.latitude for l in with_coords],
+            [l.longitude for l in with_coords],
+        )
+        for listing, (nearest, distance) in zip(with_coords, results):
+            listing.nearest_downtown = nearest
+            listing.distance_to_downtown = distance
+
     logger.info(f"Enrichment complete. {len(enriched)} listings processed.")
     return enriched
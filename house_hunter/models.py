@@ -1,13 +1,34 @@
 """Data models for house listings."""
 
-from dataclasses import dataclass, field
+import re
+from dataclasses import dataclass, fields
 from typing import Optional
-from datetime import datetime
 
-
-@dataclass
+# Compiled once at import: one DFA pass over the description replaces a
+# substring scan (plus a lowercased copy) per fractional keyword
+_FRACTIONAL_RE = re.compile(
+    r"co[- ]?ownership"
+    r"|fractional"
+    r"|time[- ]?share"
+    r"|1/[248] ownership"
+    r"|\.(?:125|25|5) ownership"
+    r"|(?:shared|partial) ownership",
+    re.IGNORECASE,
+)
+
+# Excluded property types (no condos, apartments, or manufactured/other)
+_EXCLUDED_PROPERTY_TYPES = frozenset(
+    {"condo", "condominium", "apartment", "other", "manufactured"}
+)
+
+
+@dataclass(slots=True)
 class Listing:
-    """Represents a real estate listing with all relevant data."""
+    """Represents a real estate listing with all relevant data.
+
+    Slotted to drop the per-instance __dict__ — meaningfully smaller
+    and faster on attribute access when thousands are held at once.
+    """
 
     # Core identification
     id: str  # Unique identifier (e.g., Redfin listing ID)
@@ -60,49 +81,19 @@ class Listing:
     value_score: Optional[float] = None
 
     # Metadata
-    last_updated: str = field(default_factory=lambda: datetime.now().isoformat())
+    # Stamped per fetched batch by the fetcher rather than via a
+    # default_factory, so bulk parsing skips a datetime.now() per instance
+    last_updated: str = ""
     photo_url: Optional[str] = None
     description: Optional[str] = None
 
     def to_dict(self) -> dict:
-        """Convert listing to dictionary for JSON serialization."""
-        return {
-            "id": self.id,
-            "source": self.source,
-            "url": self.url,
-            "address": self.address,
-            "city": self.city,
-            "state": self.state,
-            "zip_code": self.zip_code,
-            "latitude": self.latitude,
-            "longitude": self.longitude,
-            "price": self.price,
-            "beds": self.beds,
-            "baths": self.baths,
-            "sqft": self.sqft,
-            "lot_sqft": self.lot_sqft,
-            "year_built": self.year_built,
-            "property_type": self.property_type,
-            "stories": self.stories,
-            "hoa_monthly": self.hoa_monthly,
-            "annual_tax": self.annual_tax,
-            "days_on_market": self.days_on_market,
-            "list_date": self.list_date,
-            "has_pool": self.has_pool,
-            "has_yard": self.has_yard,
-            "has_solar": self.has_solar,
-            "has_garage": self.has_garage,
-            "has_basement": self.has_basement,
-            "garage_spaces": self.garage_spaces,
-            "walk_score": self.walk_score,
-            "crime_index": self.crime_index,
-            "distance_to_downtown": self.distance_to_downtown,
-            "nearest_downtown": self.nearest_downtown,
-            "value_score": self.value_score,
-            "last_updated": self.last_updated,
-            "photo_url": self.photo_url,
-            "description": self.description,
-        }
+        """Convert listing to dictionary for JSON serialization.
+
+        A flat getattr sweep over the precomputed field names; asdict()
+        would re-walk the field list and deep-copy every value per call.
+        """
+        return {name: getattr(self, name) for name in _LISTING_FIELDS}
 
     @classmethod
     def from_dict(cls, data: dict) -> "Listing":
@@ -110,9 +101,22 @@ class Listing:
         return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
 
     def passes_hard_filters(self) -> bool:
-        """Check if listing passes all hard filter requirements."""
+        """Check if listing passes all hard filter requirements.
+
+        Checks are ordered cheapest/most-selective first so typical
+        rejects exit after one or two comparisons, and the description
+        scan — the only non-constant-cost check — runs last.
+        """
         from . import config
 
+        # Price check (single comparison, rejects the most listings)
+        if self.price > config.PRICE_RANGE[1]:
+            return False
+
+        # Property type check
+        if self.property_type.lower() in _EXCLUDED_PROPERTY_TYPES:
+            return False
+
         # Beds check
         if self.beds < config.MIN_BEDS:
             return False
@@ -125,30 +129,16 @@ class Listing:
         if self.sqft < config.MIN_SQFT:
             return False
 
-        # Price check
-        if self.price > config.PRICE_RANGE[1]:
-            return False
-
         # Year built check
         if self.year_built and self.year_built < config.MIN_YEAR_BUILT:
             return False
 
-        # Property type check (no condos, apartments, or manufactured/other)
-        if self.property_type.lower() in ["condo", "condominium", "apartment", "other", "manufactured"]:
-            return False
-
         # Fractional/co-ownership check
-        if self.description:
-            desc_lower = self.description.lower()
-            fractional_keywords = [
-                "co-ownership", "coownership", "co ownership",
-                "fractional", "timeshare", "time share",
-                "1/8 ownership", "1/4 ownership", "1/2 ownership",
-                "shared ownership", "partial ownership",
-                ".125 ownership", ".25 ownership", ".5 ownership",
-            ]
-            for keyword in fractional_keywords:
-                if keyword in desc_lower:
-                    return False
+        if self.description and _FRACTIONAL_RE.search(self.description):
+            return False
 
         return True
+
+
+# Field names resolved once at import for to_dict's getattr sweep
+_LISTING_FIELDS = tuple(f.name for f in fields(Listing))
@@ -4,12 +4,22 @@ import logging
 from typing import List, Optional
 from statistics import mean, stdev
 
+import numpy as np
+
 from .models import Listing
 from . import config
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Location preferences flattened to an index table once at import: the
+# batch scorer maps cities to small ints and resolves the weights with
+# one fancy-index instead of a float dict lookup per listing. The extra
+# trailing slot holds the default for unknown cities.
+_CITY_INDEX = {city: i for i, city in enumerate(config.LOCATION_WEIGHTS)}
+_DEFAULT_CITY_IDX = len(_CITY_INDEX)
+_LOCATION_WEIGHTS = np.array(list(config.LOCATION_WEIGHTS.values()) + [0.80])
+
 
 def normalize_value(value: float, values: List[float], invert: bool = False) -> float:
     """
@@ -19,8 +29,15 @@ def normalize_value(value: float, values: List[float], invert: bool = False) ->
     if not values or len(values) < 2:
         return 0.5
 
-    min_val = min(values)
-    max_val = max(values)
+    if len(values) >= 32:
+        # NumPy's C reductions beat builtin min/max on larger lists;
+        # below that the array conversion overhead dominates
+        arr = np.asarray(values, dtype=np.float64)
+        min_val = float(arr.min())
+        max_val = float(arr.max())
+    else:
+        min_val = min(values)
+        max_val = max(values)
 
     if max_val == min_val:
         return 0.5
@@ -33,11 +50,61 @@ def normalize_value(value: float, values: List[float], invert: bool = False) ->
     return max(0, min(1, normalized))  # Clamp to 0-1
 
 
-def calculate_value_score(listing: Listing, all_listings: List[Listing]) -> float:
+def normalize_range(value: float, bounds: Optional[tuple], invert: bool = False) -> float:
+    """
+    Normalize a value to 0-1 using precomputed (min, max) bounds.
+    Returns 0.5 when there's no usable range, matching normalize_value.
+    """
+    if bounds is None:
+        return 0.5
+
+    min_val, max_val = bounds
+    if max_val == min_val:
+        return 0.5
+
+    normalized = (value - min_val) / (max_val - min_val)
+
+    if invert:
+        normalized = 1 - normalized
+
+    return max(0, min(1, normalized))
+
+
+def compute_normalization_stats(listings: List[Listing]) -> dict:
+    """
+    Compute the per-feature (min, max) bounds used for normalization
+    from an in-memory listing population. Mirrors the shape of
+    database.get_normalization_stats for callers that already hold
+    the listings.
+    """
+    sqft_per_dollar_values = [l.sqft / l.price for l in listings if l.price > 0 and l.sqft > 0]
+    year_values = [l.year_built for l in listings if l.year_built]
+    hoa_values = [l.hoa_monthly for l in listings if l.hoa_monthly is not None]
+    dom_values = [l.days_on_market for l in listings if l.days_on_market is not None]
+
+    def _bounds(values):
+        return (min(values), max(values)) if values else None
+
+    return {
+        "sqft_per_dollar": _bounds(sqft_per_dollar_values),
+        "year_built": _bounds(year_values),
+        "hoa_monthly": _bounds(hoa_values),
+        "days_on_market": _bounds(dom_values),
+    }
+
+
+def calculate_value_score(
+    listing: Listing, all_listings: List[Listing], stats: Optional[dict] = None
+) -> float:
     """
     Calculate a value score from 0-100 for a listing.
     Higher scores indicate better value.
 
+    `stats` holds the per-feature (min, max) normalization bounds from
+    compute_normalization_stats; when omitted they are derived from
+    `all_listings`. score_all_listings computes them once and shares
+    them across the batch instead of rescanning per listing.
+
     Weights (from config):
     - sqft_value: 23 - Square footage per dollar
     - year_built: 20 - Newer is better
@@ -52,43 +119,30 @@ def calculate_value_score(listing: Listing, all_listings: List[Listing]) -> floa
     scores = {}
     weights = config.WEIGHTS
 
-    # Collect values from all listings for normalization
-    sqft_per_dollar_values = []
-    year_values = []
-    hoa_values = []
-    dom_values = []
-
-    for l in all_listings:
-        if l.price > 0 and l.sqft > 0:
-            sqft_per_dollar_values.append(l.sqft / l.price)
-        if l.year_built:
-            year_values.append(l.year_built)
-        if l.hoa_monthly is not None:
-            hoa_values.append(l.hoa_monthly)
-        if l.days_on_market is not None:
-            dom_values.append(l.days_on_market)
+    if stats is None:
+        stats = compute_normalization_stats(all_listings)
 
     # 1. Square footage per dollar (higher = better value)
     if listing.price > 0 and listing.sqft > 0:
         sqft_per_dollar = listing.sqft / listing.price
-        scores["sqft_value"] = normalize_value(
-            sqft_per_dollar, sqft_per_dollar_values
+        scores["sqft_value"] = normalize_range(
+            sqft_per_dollar, stats["sqft_per_dollar"]
         ) * weights["sqft_value"]
     else:
         scores["sqft_value"] = 0
 
     # 2. Year built (newer = better)
-    if listing.year_built and year_values:
-        scores["year_built"] = normalize_value(
-            listing.year_built, year_values
+    if listing.year_built and stats["year_built"] is not None:
+        scores["year_built"] = normalize_range(
+            listing.year_built, stats["year_built"]
         ) * weights["year_built"]
     else:
         scores["year_built"] = weights["year_built"] * 0.5  # Default to middle
 
     # 3. Low HOA (lower = better, so invert)
-    if listing.hoa_monthly is not None and hoa_values:
-        scores["low_hoa"] = normalize_value(
-            listing.hoa_monthly, hoa_values, invert=True
+    if listing.hoa_monthly is not None and stats["hoa_monthly"] is not None:
+        scores["low_hoa"] = normalize_range(
+            listing.hoa_monthly, stats["hoa_monthly"], invert=True
         ) * weights["low_hoa"]
     else:
         # No HOA is best
@@ -102,9 +156,9 @@ def calculate_value_score(listing: Listing, all_listings: List[Listing]) -> floa
     scores["private_yard"] = weights["private_yard"] if listing.has_yard else 0
 
     # 6. Days on market (higher = potential deal)
-    if listing.days_on_market is not None and dom_values:
-        scores["days_on_market"] = normalize_value(
-            listing.days_on_market, dom_values
+    if listing.days_on_market is not None and stats["days_on_market"] is not None:
+        scores["days_on_market"] = normalize_range(
+            listing.days_on_market, stats["days_on_market"]
         ) * weights["days_on_market"]
     else:
         scores["days_on_market"] = weights["days_on_market"] * 0.5
@@ -123,45 +177,159 @@ def calculate_value_score(listing: Listing, all_listings: List[Listing]) -> floa
     return round(total_score, 1)
 
 
-def score_all_listings(listings: List[Listing]) -> List[Listing]:
+def _normalize_array(
+    values: np.ndarray, bounds: Optional[tuple], invert: bool = False
+) -> np.ndarray:
+    """Vectorized normalize_range over an array of values."""
+    if bounds is None or bounds[0] == bounds[1]:
+        return np.full(values.shape, 0.5)
+
+    normalized = (values - bounds[0]) / (bounds[1] - bounds[0])
+
+    if invert:
+        normalized = 1.0 - normalized
+
+    return np.clip(normalized, 0.0, 1.0)
+
+
+def _score_batch(listings: List[Listing], stats: dict) -> np.ndarray:
+    """
+    Compute value scores for a whole batch with NumPy column arrays.
+
+    Structure-of-arrays version of calculate_value_score: each feature
+    becomes one contiguous array and the weighted terms are summed with
+    ufuncs instead of per-listing attribute lookups. Produces the same
+    scores as the scalar path.
+    """
+    weights = config.WEIGHTS
+    n = len(listings)
+
+    prices = np.array([l.price for l in listings], dtype=np.float64)
+    sqft = np.array([l.sqft for l in listings], dtype=np.float64)
+    # 0 / -1 sentinels stand in for None; the masks below exclude them
+    years = np.array([l.year_built or 0 for l in listings], dtype=np.float64)
+    hoa = np.array(
+        [-1.0 if l.hoa_monthly is None else l.hoa_monthly for l in listings]
+    )
+    dom = np.array(
+        [-1.0 if l.days_on_market is None else l.days_on_market for l in listings]
+    )
+
+    # 1. Square footage per dollar (higher = better value)
+    sellable = (prices > 0) & (sqft > 0)
+    sqft_per_dollar = np.divide(sqft, prices, out=np.zeros(n), where=sellable)
+    total = np.where(
+        sellable,
+        _normalize_array(sqft_per_dollar, stats["sqft_per_dollar"]) * weights["sqft_value"],
+        0.0,
+    )
+
+    # 2. Year built (newer = better; unknown defaults to middle)
+    if stats["year_built"] is not None:
+        year_term = np.where(
+            years > 0, _normalize_array(years, stats["year_built"]), 0.5
+        )
+    else:
+        year_term = np.full(n, 0.5)
+    total += year_term * weights["year_built"]
+
+    # 3. Low HOA (lower = better; no HOA data is best)
+    if stats["hoa_monthly"] is not None:
+        hoa_term = np.where(
+            hoa >= 0, _normalize_array(hoa, stats["hoa_monthly"], invert=True), 1.0
+        )
+    else:
+        hoa_term = np.ones(n)
+    total += hoa_term * weights["low_hoa"]
+
+    # 4. Location preference via the precomputed city-index table
+    city_idx = np.fromiter(
+        (_CITY_INDEX.get(l.city, _DEFAULT_CITY_IDX) for l in listings),
+        dtype=np.intp,
+        count=n,
+    )
+    total += _LOCATION_WEIGHTS[city_idx] * weights["location"]
+
+    # 5-8. Boolean features and days on market
+    total += np.array([l.has_yard for l in listings]) * weights["private_yard"]
+
+    if stats["days_on_market"] is not None:
+        dom_term = np.where(
+            dom >= 0, _normalize_array(dom, stats["days_on_market"]), 0.5
+        )
+    else:
+        dom_term = np.full(n, 0.5)
+    total += dom_term * weights["days_on_market"]
+
+    total += np.array([l.has_pool for l in listings]) * weights["pool"]
+    total += np.array([l.has_solar for l in listings]) * weights["solar"]
+
+    # Unrounded: callers round with builtin round(), which is correctly
+    # rounded where np.round's scale-and-divide can drift by one ulp
+    return total
+
+
+def score_all_listings(
+    listings: List[Listing], top_k: Optional[int] = None
+) -> List[Listing]:
     """
     Calculate value scores for all listings.
     Modifies listings in place and returns them sorted by score (descending).
+
+    With `top_k` set, only the K best listings are returned: an O(N)
+    argpartition selects them and just those K are sorted, instead of
+    sorting the whole population to show a handful.
     """
     logger.info(f"Scoring {len(listings)} listings...")
 
     # Filter to only valid listings for scoring
     valid_listings = [l for l in listings if l.price > 0]
 
-    for listing in valid_listings:
-        listing.value_score = calculate_value_score(listing, valid_listings)
-
-    # Sort by value score (highest first)
-    valid_listings.sort(key=lambda l: l.value_score or 0, reverse=True)
+    # One pass over the population for the normalization bounds, then
+    # the whole batch is scored with column arrays in a few ufunc calls
+    stats = compute_normalization_stats(valid_listings)
+
+    scores = None
+    if valid_listings:
+        scores = _score_batch(valid_listings, stats)
+        for listing, score in zip(valid_listings, scores.tolist()):
+            listing.value_score = round(score, 1)
+
+    if top_k is not None and scores is not None and top_k < len(valid_listings):
+        top_idx = np.argpartition(-scores, top_k)[:top_k]
+        top_idx = top_idx[np.argsort(-scores[top_idx], kind="stable")]
+        top = [valid_listings[i] for i in top_idx]
+        logger.info(f"Scoring complete. Top score: {top[0].value_score}")
+        return top
+
+    # Sort by value score (highest first). The scores already sit in a
+    # contiguous float64 array, so argsort runs the comparisons in C;
+    # stable on the negated array keeps ties in input order, matching
+    # the list sort it replaces
+    if scores is not None:
+        order = np.argsort(-scores, kind="stable")
+        valid_listings = [valid_listings[i] for i in order]
 
     logger.info(f"Scoring complete. Top score: {valid_listings[0].value_score if valid_listings else 'N/A'}")
 
     return valid_listings
 
 
-def get_score_breakdown(listing: Listing, all_listings: List[Listing]) -> dict:
+def get_score_breakdown(listing: Listing, stats: dict) -> dict:
     """
     Get a detailed breakdown of how a listing's score was calculated.
     Useful for displaying to users.
+
+    `stats` holds the per-feature (min, max) normalization bounds, from
+    database.get_normalization_stats or compute_normalization_stats.
     """
     weights = config.WEIGHTS
     breakdown = {}
 
-    # Collect values from all listings for normalization
-    sqft_per_dollar_values = [l.sqft / l.price for l in all_listings if l.price > 0 and l.sqft > 0]
-    year_values = [l.year_built for l in all_listings if l.year_built]
-    hoa_values = [l.hoa_monthly for l in all_listings if l.hoa_monthly is not None]
-    dom_values = [l.days_on_market for l in all_listings if l.days_on_market is not None]
-
     # Sqft per dollar
     if listing.price > 0 and listing.sqft > 0:
         sqft_per_dollar = listing.sqft / listing.price
-        raw_score = normalize_value(sqft_per_dollar, sqft_per_dollar_values)
+        raw_score = normalize_range(sqft_per_dollar, stats["sqft_per_dollar"])
         breakdown["sqft_value"] = {
             "weight": weights["sqft_value"],
             "raw_value": round(sqft_per_dollar * 1000, 2),  # sqft per $1000
@@ -172,7 +340,7 @@ def get_score_breakdown(listing: Listing, all_listings: List[Listing]) -> dict:
 
     # Year built
     if listing.year_built:
-        raw_score = normalize_value(listing.year_built, year_values)
+        raw_score = normalize_range(listing.year_built, stats["year_built"])
         breakdown["year_built"] = {
             "weight": weights["year_built"],
             "raw_value": listing.year_built,
@@ -183,8 +351,8 @@ def get_score_breakdown(listing: Listing, all_listings: List[Listing]) -> dict:
 
     # HOA
     hoa_val = listing.hoa_monthly if listing.hoa_monthly is not None else 0
-    if hoa_values:
-        raw_score = normalize_value(hoa_val, hoa_values, invert=True)
+    if stats["hoa_monthly"] is not None:
+        raw_score = normalize_range(hoa_val, stats["hoa_monthly"], invert=True)
     else:
         raw_score = 1 if hoa_val == 0 else 0.5
     breakdown["low_hoa"] = {
@@ -215,8 +383,8 @@ def get_score_breakdown(listing: Listing, all_listings: List[Listing]) -> dict:
     }
 
     # DOM
-    if listing.days_on_market is not None and dom_values:
-        raw_score = normalize_value(listing.days_on_market, dom_values)
+    if listing.days_on_market is not None and stats["days_on_market"] is not None:
+        raw_score = normalize_range(listing.days_on_market, stats["days_on_market"])
         breakdown["days_on_market"] = {
             "weight": weights["days_on_market"],
             "raw_value": listing.days_on_market,
@@ -0,0 +1,43 @@
+"""Shared test configuration."""
+
+import cProfile
+import os
+import tempfile
+
+import pytest
+
+# Point the suite at a throwaway database before house_hunter.config is
+# imported. A real temp file rather than ":memory:" because the code
+# opens a fresh connection per operation outside app context, and each
+# in-memory connection would see its own empty database.
+os.environ.setdefault(
+    "HOUSE_HUNTER_DB",
+    os.path.join(tempfile.mkdtemp(prefix="house-hunter-tests-"), "listings.db"),
+)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--profile",
+        action="store_true",
+        help="Profile the whole session with cProfile; stats land in prof/combined.prof",
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _session_profile(request):
+    """Wrap the session in cProfile when --profile is passed.
+
+    Read the dump with `python -m pstats prof/combined.prof` (or
+    snakeviz) to see where suite time actually goes before optimizing.
+    """
+    if not request.config.getoption("--profile"):
+        yield
+        return
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    yield
+    profiler.disable()
+    os.makedirs("prof", exist_ok=True)
+    profiler.dump_stats(os.path.join("prof", "combined.prof"))
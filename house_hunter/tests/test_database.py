@@ -0,0 +1,117 @@
+"""Unit tests for database round-trips, including migrated schemas."""
+
+import os
+import sqlite3
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from house_hunter import config, database
+from house_hunter.models import Listing
+
+
+def _sample_listing() -> Listing:
+    """A listing with distinct values in the fields after `stories`,
+    so any column-order mixup shows up as a field mismatch."""
+    return Listing(
+        id="rt1",
+        source="test",
+        url="http://example.com/rt1",
+        address="12 Round Trip Rd",
+        city="Gilbert",
+        zip_code="85234",
+        latitude=33.35,
+        longitude=-111.79,
+        price=525000,
+        beds=4,
+        baths=2.5,
+        sqft=2150,
+        lot_sqft=7200,
+        year_built=2012,
+        property_type="single_family",
+        stories=2,
+        hoa_monthly=120,
+        annual_tax=3100,
+        days_on_market=21,
+        list_date="2026-08-01",
+        has_pool=True,
+        has_yard=True,
+        garage_spaces=3,
+        walk_score=44,
+        crime_index=82,
+        distance_to_downtown=6.4,
+        nearest_downtown="Gilbert",
+        value_score=58.3,
+        last_updated="2026-08-26",
+        photo_url="http://example.com/rt1.jpg",
+        description="Round-trip fixture",
+    )
+
+
+class TestListingRoundTrip(unittest.TestCase):
+    """Save/load round-trips must preserve every Listing field."""
+
+    def setUp(self):
+        """Point the module at a throwaway database file."""
+        self._tmpdir = tempfile.mkdtemp(prefix="house-hunter-db-test-")
+        self._old_db_path = config.DATABASE_PATH
+        config.DATABASE_PATH = os.path.join(self._tmpdir, "listings.db")
+
+    def tearDown(self):
+        config.DATABASE_PATH = self._old_db_path
+
+    def test_round_trip_fresh_schema(self):
+        """All fields survive save/load on a freshly created database."""
+        database.init_database()
+        original = _sample_listing()
+        database.save_listings([original])
+
+        loaded = database.get_all_listings()
+        self.assertEqual(len(loaded), 1)
+        self.assertEqual(loaded[0].to_dict(), original.to_dict())
+
+    def test_round_trip_migrated_schema(self):
+        """All fields survive save/load on a pre-`stories` database.
+
+        The stories migration appends the column at the end of the
+        table, so SELECT * returns it out of declaration order there;
+        hydration must not depend on table order. Regression test for
+        the positional _row_to_listing rewrite.
+        """
+        # Build the old schema by hand: every column except stories
+        columns = [c for c in database.LISTING_COLUMNS if c != "stories"]
+        conn = sqlite3.connect(database.get_db_path())
+        conn.execute(
+            "CREATE TABLE listings ({})".format(
+                ", ".join(
+                    f"{c} TEXT PRIMARY KEY" if c == "id" else c
+                    for c in columns
+                )
+            )
+        )
+        conn.commit()
+        conn.close()
+
+        # init_database runs the migration, appending stories at the end
+        database.init_database()
+        original = _sample_listing()
+        database.save_listings([original])
+
+        loaded = database.get_all_listings()
+        self.assertEqual(len(loaded), 1)
+        self.assertEqual(loaded[0].to_dict(), original.to_dict())
+
+        by_id = database.get_listing_by_id("rt1")
+        self.assertEqual(by_id.to_dict(), original.to_dict())
+
+        filtered = database.get_filtered_listings(min_beds=4)
+        self.assertEqual(len(filtered), 1)
+        self.assertEqual(filtered[0].to_dict(), original.to_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,6 +9,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from house_hunter.models import Listing
 from house_hunter.enrichment import (
+    enrich_listing,
     get_crime_index,
     GeoEnricher,
 )
@@ -46,8 +47,10 @@ class TestCrimeIndex(unittest.TestCase):
 class TestGeoEnricher(unittest.TestCase):
     """Test geographic enrichment functions."""
 
-    def setUp(self):
-        self.enricher = GeoEnricher()
+    @classmethod
+    def setUpClass(cls):
+        """One enricher for the class; it holds no per-test state."""
+        cls.enricher = GeoEnricher()
 
     def test_calculate_distance_same_point(self):
         """Test distance between same point is 0."""
@@ -93,9 +96,12 @@ class TestListingEnrichment(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        """Initialize database for tests."""
+        """Initialize the test database once for the class."""
         from house_hunter import database
         database.init_database()
+        # Pre-cache the fixture address so enrichment resolves it from
+        # the database instead of calling the live geocoder
+        database.save_enrichment_cache("123 Test, Gilbert, AZ", None, 33.3528, -111.7890)
 
     def test_yard_inference_from_lot_size(self):
         """Test that yard is inferred from lot size."""
@@ -110,7 +116,6 @@ class TestListingEnrichment(unittest.TestCase):
         )
 
         # After enrichment, has_yard should be True for lot > 3000
-        from house_hunter.enrichment import enrich_listing
         enriched = enrich_listing(listing)
         self.assertTrue(enriched.has_yard)
 
@@ -126,7 +131,6 @@ class TestListingEnrichment(unittest.TestCase):
             has_yard=False,
         )
 
-        from house_hunter.enrichment import enrich_listing
         enriched = enrich_listing(listing)
         self.assertFalse(enriched.has_yard)
 
@@ -140,7 +144,6 @@ class TestListingEnrichment(unittest.TestCase):
             city="Gilbert",
         )
 
-        from house_hunter.enrichment import enrich_listing
         enriched = enrich_listing(listing)
         self.assertEqual(enriched.crime_index, 85)
 
@@ -56,9 +56,14 @@ class TestNormalization(unittest.TestCase):
 class TestScoring(unittest.TestCase):
     """Test the value scoring algorithm."""
 
-    def setUp(self):
-        """Create sample listings for testing."""
-        self.listings = [
+    @classmethod
+    def setUpClass(cls):
+        """Build the sample listings once for the whole class.
+
+        score_all_listings assigns value_score on the shared elements
+        in place, so setUp below resets it before each test.
+        """
+        cls.listings = (
             Listing(
                 id="1",
                 source="test",
@@ -113,7 +118,12 @@ class TestScoring(unittest.TestCase):
                 has_yard=False,
                 has_solar=False,
             ),
-        ]
+        )
+
+    def setUp(self):
+        """Clear scores left behind by tests that run score_all_listings."""
+        for listing in self.listings:
+            listing.value_score = None
 
     def test_calculate_value_score_returns_number(self):
         """Test that calculate_value_score returns a numeric score."""
@@ -146,7 +156,7 @@ class TestScoring(unittest.TestCase):
 
     def test_score_all_listings_sorts(self):
         """Test that score_all_listings returns sorted results."""
-        scored = score_all_listings(self.listings.copy())
+        scored = score_all_listings(list(self.listings))
 
         # Check descending order
         for i in range(len(scored) - 1):
@@ -157,7 +167,7 @@ class TestScoring(unittest.TestCase):
 
     def test_score_assigned_to_listing(self):
         """Test that scoring assigns value_score to listings."""
-        scored = score_all_listings(self.listings.copy())
+        scored = score_all_listings(list(self.listings))
 
         for listing in scored:
             self.assertIsNotNone(listing.value_score)
@@ -0,0 +1,10 @@
+"""WSGI entry point for production servers.
+
+Run with multiple workers instead of the single-threaded dev server:
+
+    gunicorn -w 4 -k gthread house_hunter.wsgi:app
+"""
+
+from .app import create_app
+
+app = create_app()
@@ -3,16 +3,21 @@ Arizona House Hunter - Streamlit Web App
 Mobile-friendly real estate listing analysis for Phoenix & Tucson metro areas.
 """
 
+import os
+
 import streamlit as st
+import numpy as np
 import pandas as pd
+from dataclasses import fields
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 
-# Import backend modules
+# Import backend modules. Only the ones every rerun needs are loaded
+# here; the fetch/enrich/score stack (requests, bs4, geopy) is imported
+# inside refresh_data, so viewing cached data never pays for it
 from house_hunter import database, config
 from house_hunter.models import Listing
-from house_hunter.fetcher import fetch_listings
-from house_hunter.enrichment import enrich_listing
-from house_hunter.scoring import score_all_listings
 
 # Page config - must be first Streamlit command
 st.set_page_config(
@@ -22,213 +27,141 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Dark mode CSS
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=DM+Sans:wght@400;500;600;700&display=swap');
-
-    :root {
-        --bg-primary: #1a1a1a;
-        --bg-secondary: #242424;
-        --bg-card: #2a2a2a;
-        --text-primary: #f0f0f0;
-        --text-secondary: #a0a0a0;
-        --accent: #C4704B;
-        --accent-light: #e8a889;
-        --success: #4ade80;
-        --warning: #fbbf24;
-    }
+@lru_cache(maxsize=1)
+def _load_css() -> str:
+    """Read the stylesheet once per process; reruns reuse the string."""
+    return Path(__file__).with_name("streamlit_style.css").read_text()
 
-    .stApp {
-        background-color: var(--bg-primary);
-    }
 
-    #MainMenu, footer, header {visibility: hidden;}
+# Font loaded via link tags with a preconnect instead of a CSS @import,
+# which blocks the stylesheet parse until the font CSS round-trips
+_FONT_LINKS = (
+    '<link rel="preconnect" href="https://fonts.googleapis.com">'
+    '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+    '<link rel="stylesheet" href="https://fonts.googleapis.com/css2'
+    '?family=DM+Sans:wght@400;500;600;700&display=swap">'
+)
 
-    /* Stats row */
-    .stats-row {
-        display: flex;
-        gap: 1rem;
-        margin-bottom: 1rem;
-    }
-    .stat-box {
-        background: var(--bg-card);
-        border-radius: 8px;
-        padding: 0.75rem 1rem;
-        flex: 1;
-        text-align: center;
-    }
-    .stat-box .value {
-        font-size: 1.25rem;
-        font-weight: 700;
-        color: var(--text-primary);
-    }
-    .stat-box .label {
-        font-size: 0.7rem;
-        color: var(--text-secondary);
-        text-transform: uppercase;
-        letter-spacing: 0.05em;
-    }
+# Dark mode CSS
+st.markdown(f"{_FONT_LINKS}<style>{_load_css()}</style>", unsafe_allow_html=True)
 
-    /* Compact listing card */
-    .compact-card {
-        background: var(--bg-card);
-        border-radius: 10px;
-        padding: 0.75rem;
-        height: 100%;
-        border: 1px solid #333;
-        transition: border-color 0.2s;
-    }
-    .compact-card:hover {
-        border-color: var(--accent);
-    }
 
-    .card-top {
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        margin-bottom: 0.5rem;
-    }
+def init_session_state():
+    """Initialize session state variables."""
+    if 'listings' not in st.session_state:
+        st.session_state.listings = []
+    if 'last_refresh' not in st.session_state:
+        st.session_state.last_refresh = None
+    if 'data_version' not in st.session_state:
+        st.session_state.data_version = 0
+    if 'page' not in st.session_state:
+        st.session_state.page = 1
 
-    .score-pill {
-        display: inline-flex;
-        align-items: center;
-        gap: 4px;
-        padding: 4px 10px;
-        border-radius: 20px;
-        font-size: 0.85rem;
-        font-weight: 700;
-    }
-    .score-high { background: #166534; color: #bbf7d0; }
-    .score-mid { background: #854d0e; color: #fef08a; }
-    .score-low { background: #7f1d1d; color: #fecaca; }
-
-    .card-price {
-        font-size: 1.1rem;
-        font-weight: 700;
-        color: var(--text-primary);
-    }
-    .card-price.ideal { color: var(--success); }
-
-    .card-address {
-        font-size: 0.85rem;
-        font-weight: 500;
-        color: var(--text-primary);
-        white-space: nowrap;
-        overflow: hidden;
-        text-overflow: ellipsis;
-        margin-bottom: 2px;
-    }
-    .card-city {
-        font-size: 0.75rem;
-        color: var(--text-secondary);
-        margin-bottom: 0.5rem;
-    }
 
-    .card-specs {
-        display: flex;
-        gap: 0.5rem;
-        flex-wrap: wrap;
-        margin-bottom: 0.5rem;
-    }
-    .spec-tag {
-        background: var(--bg-secondary);
-        padding: 3px 8px;
-        border-radius: 4px;
-        font-size: 0.75rem;
-        color: var(--text-secondary);
-    }
-    .spec-tag strong {
-        color: var(--text-primary);
-    }
+def _data_version():
+    """Cache key for the current snapshot: session counter + DB mtime.
 
-    .card-features {
-        display: flex;
-        gap: 4px;
-        flex-wrap: wrap;
-    }
-    .feature-dot {
-        width: 8px;
-        height: 8px;
-        border-radius: 50%;
-        background: var(--accent);
-    }
-    .feature-text {
-        font-size: 0.7rem;
-        color: var(--text-secondary);
-    }
+    The counter invalidates after this session's own refresh; the
+    database file's mtime additionally invalidates when another session
+    or process rewrites the listings, without waiting out the ttl.
+    """
+    try:
+        mtime = os.path.getmtime(config.DATABASE_PATH)
+    except OSError:
+        mtime = 0.0
+    return (st.session_state.data_version, mtime)
 
-    /* Override Streamlit defaults for dark mode */
-    .stSelectbox label, .stMultiSelect label, .stNumberInput label, .stCheckbox label {
-        color: var(--text-primary) !important;
-    }
 
-    .stButton > button {
-        background: var(--accent) !important;
-        color: #1a1a1a !important;
-        border: none !important;
-        border-radius: 8px !important;
-        font-weight: 600 !important;
-    }
-    .stButton > button:hover {
-        background: var(--accent-light) !important;
-        color: #1a1a1a !important;
-    }
+@st.cache_data(ttl=300, show_spinner=False)
+def _load_db_listings(version):
+    """Load listings from the database, shared across sessions.
 
-    /* Link buttons */
-    .stLinkButton > a {
-        background: var(--accent) !important;
-        color: #1a1a1a !important;
-        border-radius: 8px !important;
-    }
+    `version` comes from _data_version, so a fresh fetch - by this
+    session or any other writer - invalidates the snapshot; until then
+    every rerun and every viewer reuses one deserialized listing list
+    instead of re-querying SQLite.
+    """
+    database.init_database()
+    return database.get_all_listings()
 
-    /* Download button */
-    .stDownloadButton > button {
-        background: var(--bg-card) !important;
-        color: var(--text-primary) !important;
-        border: 1px solid #444 !important;
-    }
 
-    div[data-testid="stMetricValue"] {
-        font-size: 1.1rem !important;
-    }
+def load_listings_from_db():
+    """Load listings from database."""
+    listings = _load_db_listings(_data_version())
+    st.session_state.listings = listings
+    return listings
 
-    /* Sidebar dark */
-    section[data-testid="stSidebar"] {
-        background: var(--bg-secondary);
-    }
-    section[data-testid="stSidebar"] .stMarkdown {
-        color: var(--text-primary);
-    }
-</style>
-""", unsafe_allow_html=True)
 
+# The Listing fields, in declaration order - the export keeps these and
+# drops the derived display columns the DataFrame also carries
+_EXPORT_COLUMNS = [f.name for f in fields(Listing)]
 
-def init_session_state():
-    """Initialize session state variables."""
-    if 'listings' not in st.session_state:
-        st.session_state.listings = []
-    if 'last_refresh' not in st.session_state:
-        st.session_state.last_refresh = None
 
+@st.cache_data(ttl=300, show_spinner=False)
+def _listings_csv(version) -> bytes:
+    """CSV export of the cached snapshot, built once per data version."""
+    df = _listings_df(version)
+    if df.empty:
+        return b""
+    return df[_EXPORT_COLUMNS].to_csv(index=False).encode()
 
-def load_listings_from_db():
-    """Load listings from database."""
-    database.init_database()
-    listings = database.get_all_listings()
-    st.session_state.listings = listings
-    return listings
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _listings_df(version) -> pd.DataFrame:
+    """Column-oriented view of the cached listings.
+
+    Built once per data version; the filter masks below then run as
+    NumPy comparisons over whole columns instead of a Python branch
+    cascade per listing, and every string a card displays is derived
+    here once instead of being re-formatted on each rerun.
+    """
+    df = pd.DataFrame([l.to_dict() for l in _load_db_listings(version)])
+    if df.empty:
+        return df
+
+    scores = df['value_score'].to_numpy(dtype=np.float64)
+    df['score_str'] = ['--' if pd.isna(v) or v == 0 else str(v) for v in scores]
+    df['score_class'] = np.select(
+        [scores >= 55, scores >= 40], ['score-high', 'score-mid'], 'score-low'
+    )
+    prices = df['price'].fillna(0)
+    df['price_class'] = np.where((prices > 0) & (prices <= 600000), 'ideal', '')
+    df['price_compact'] = prices.map(format_compact_price)
+    df['price_str'] = prices.map(format_price)
+    df['sqft_str'] = df['sqft'].fillna(0).map('{:,.0f}'.format)
+    sqft = df['sqft'].fillna(0).to_numpy(dtype=np.float64)
+    price_arr = prices.to_numpy(dtype=np.float64)
+    ratio = np.divide(
+        price_arr, sqft, out=np.zeros_like(price_arr), where=sqft > 0
+    ).astype(np.int64)
+    df['ppsqft'] = np.where(sqft > 0, ratio.astype(str), '--')
+    df['hoa_str'] = [
+        'None' if pd.isna(v) or v == 0 else f'${int(v)}/mo' for v in df['hoa_monthly']
+    ]
+    for source, target in (
+        ('year_built', 'year_str'),
+        ('days_on_market', 'dom_str'),
+        ('crime_index', 'crime_str'),
+    ):
+        df[target] = [
+            'N/A' if pd.isna(v) or v == 0 else str(int(v)) for v in df[source]
+        ]
+    df['features_html'] = [
+        _features_html(pool, yard, solar)
+        for pool, yard, solar in zip(df['has_pool'], df['has_yard'], df['has_solar'])
+    ]
+    return df
 
 
 def refresh_data():
     """Fetch fresh data from Redfin API with progress tracking."""
     import time
+    from concurrent.futures import ThreadPoolExecutor, as_completed
     from house_hunter.fetcher import RedfinFetcher
-    from house_hunter import config as hh_config
+    from house_hunter.enrichment import enrich_all_listings
+    from house_hunter.scoring import score_all_listings
 
-    all_listings = []
-    seen_ids = set()
-    cities = list(hh_config.REDFIN_REGIONS.keys())
+    cities = list(config.REDFIN_REGIONS.keys())
 
     # Progress UI
     progress_bar = st.progress(0)
@@ -237,23 +170,33 @@ def refresh_data():
     fetcher = RedfinFetcher()
     total_steps = len(cities) + 2  # cities + enrich + score
 
-    # Fetch from each city
-    for i, city in enumerate(cities):
-        progress_bar.progress(i / total_steps)
-        status_text.text(f"📍 Fetching {city}... ({i+1}/{len(cities)})")
-
-        try:
-            listings = fetcher.fetch_city_listings(city)
-            for listing in listings:
-                if listing.id not in seen_ids:
-                    seen_ids.add(listing.id)
-                    all_listings.append(listing)
-            status_text.text(f"✓ {city}: {len(listings)} homes ({len(all_listings)} total)")
-        except Exception as e:
-            status_text.text(f"⚠ {city}: {str(e)[:40]}")
-
-        if i < len(cities) - 1:
-            time.sleep(1.5)
+    # Fetch all cities concurrently; each fetch is dominated by its
+    # HTTP round-trip, so the phase takes the slowest city instead of
+    # the sum of all of them
+    all_listings = []
+    seen_ids = set()
+    parsed_ids = set()
+    run_ts = datetime.now().isoformat()
+
+    with ThreadPoolExecutor(max_workers=RedfinFetcher.FETCH_WORKERS) as executor:
+        futures = {
+            executor.submit(fetcher.fetch_city_listings, city, parsed_ids, run_ts): city
+            for city in cities
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            city = futures[future]
+            try:
+                listings = future.result()
+                # Authoritative dedup here, single-threaded; workers can
+                # race on the shared pre-parse parsed_ids check
+                for listing in listings:
+                    if listing.id not in seen_ids:
+                        seen_ids.add(listing.id)
+                        all_listings.append(listing)
+                status_text.text(f"✓ {city}: {len(listings)} homes ({len(all_listings)} total)")
+            except Exception as e:
+                status_text.text(f"⚠ {city}: {str(e)[:40]}")
+            progress_bar.progress(done / total_steps)
 
     if not all_listings:
         progress_bar.empty()
@@ -261,68 +204,37 @@ def refresh_data():
         st.error("No listings fetched. Redfin may be unavailable.")
         return
 
-    # Enrich with progress
-    from house_hunter.enrichment import GeoEnricher
-    geo_enricher = GeoEnricher()  # Shared instance
-
-    enriched = []
-    enrich_container = st.empty()
-
-    for i, listing in enumerate(all_listings):
-        # Update progress display
-        pct = int((i + 1) / len(all_listings) * 100)
-        enrich_container.markdown(f"""
-        <div style="background: #242424; padding: 1rem; border-radius: 8px; margin: 0.5rem 0;">
-            <div style="display: flex; justify-content: space-between; margin-bottom: 0.5rem;">
-                <span style="color: #a0a0a0;">🔍 Enriching listings...</span>
-                <span style="color: #f0f0f0; font-weight: 600;">{i+1} / {len(all_listings)}</span>
-            </div>
-            <div style="background: #333; border-radius: 4px; height: 8px; overflow: hidden;">
-                <div style="background: #C4704B; height: 100%; width: {pct}%; transition: width 0.1s;"></div>
-            </div>
-            <div style="color: #666; font-size: 0.8rem; margin-top: 0.5rem; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;">
-                {listing.address[:40]}{'...' if len(listing.address) > 40 else ''}
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-
-        try:
-            enriched_listing = enrich_listing(listing, geo_enricher)
-            enriched.append(enriched_listing)
-        except:
-            enriched.append(listing)
-
-    enrich_container.empty()
+    # Enrich as one batch: the bulk path primes the geocode cache with
+    # a single SELECT and computes downtown distances vectorized
+    status_text.text(f"🔍 Enriching {len(all_listings)} listings...")
+    enriched = enrich_all_listings(all_listings)
 
     # Score
     status_text.text("📊 Calculating value scores...")
     progress_bar.progress((len(cities) + 1) / total_steps)
     scored = score_all_listings(enriched)
 
-    # Save
+    # Save: one transaction swaps the old listings for the new set
     status_text.text("💾 Saving...")
     progress_bar.progress(1.0)
-    database.delete_all_listings()
-    database.save_listings(scored)
+    database.replace_all_listings(scored)
 
-    st.session_state.listings = scored
     st.session_state.last_refresh = datetime.now()
+    # Invalidate the cached DB snapshot for every session, then reload
+    # through the cache so the listing list and its DataFrame twin stay
+    # row-aligned
+    st.session_state.data_version += 1
+    _load_db_listings.clear()
+    load_listings_from_db()
 
     progress_bar.empty()
     status_text.empty()
     st.success(f"✓ Loaded {len(scored)} listings!")
     time.sleep(1)
-    st.rerun()
-
-
-def get_score_class(score):
-    if not score:
-        return "score-low"
-    if score >= 55:
-        return "score-high"
-    if score >= 40:
-        return "score-mid"
-    return "score-low"
+    # Full-app scope: refresh is also reachable from the empty-state
+    # button inside the results fragment, and new data must redraw
+    # everything, not just the fragment
+    st.rerun(scope="app")
 
 
 def format_price(price):
@@ -339,83 +251,169 @@ def format_compact_price(price):
     return f"${price/1000:.0f}K"
 
 
-def render_compact_card(listing: Listing):
-    """Render a compact listing card."""
-    score_class = get_score_class(listing.value_score)
-    price_class = "ideal" if listing.price and listing.price <= 600000 else ""
-
+def _features_html(has_pool, has_yard, has_solar):
+    """Feature dots + label for a card, built once at ingestion."""
     features = []
-    if listing.has_pool:
+    if has_pool:
         features.append("Pool")
-    if listing.has_yard:
+    if has_yard:
         features.append("Yard")
-    if listing.has_solar:
+    if has_solar:
         features.append("Solar")
 
-    features_html = " ".join([f'<span class="feature-dot" title="{f}"></span>' for f in features])
+    html = " ".join([f'<span class="feature-dot" title="{f}"></span>' for f in features])
     if features:
-        features_html += f' <span class="feature-text">{", ".join(features)}</span>'
-
-    return f"""
-    <div class="compact-card">
-        <div class="card-top">
-            <span class="score-pill {score_class}">{listing.value_score or '--'}</span>
-            <span class="card-price {price_class}">{format_compact_price(listing.price)}</span>
-        </div>
-        <div class="card-address">{listing.address}</div>
-        <div class="card-city">{listing.city} · {listing.year_built or 'N/A'}</div>
-        <div class="card-specs">
-            <span class="spec-tag"><strong>{listing.beds}</strong> bd</span>
-            <span class="spec-tag"><strong>{listing.baths}</strong> ba</span>
-            <span class="spec-tag"><strong>{listing.sqft:,}</strong> sqft</span>
-            <span class="spec-tag">${int(listing.price/listing.sqft) if listing.sqft else '--'}/ft</span>
-        </div>
-        <div class="card-features">{features_html}</div>
-    </div>
+        html += f' <span class="feature-text">{", ".join(features)}</span>'
+    return html
+
+
+# Card markup defined once at module level; render_compact_card only
+# substitutes the precomputed row values into it
+_CARD_TEMPLATE = """<div class="compact-card">
+<div class="card-top">
+<span class="score-pill {score_class}">{score_str}</span>
+<span class="card-price {price_class}">{price_compact}</span>
+</div>
+<div class="card-address">{address}</div>
+<div class="card-city">{city} · {year_str}</div>
+<div class="card-specs">
+<span class="spec-tag"><strong>{beds}</strong> bd</span>
+<span class="spec-tag"><strong>{baths}</strong> ba</span>
+<span class="spec-tag"><strong>{sqft_str}</strong> sqft</span>
+<span class="spec-tag">${ppsqft}/ft</span>
+</div>
+<div class="card-features">{features_html}</div>
+<details class="card-details">
+<summary>Details</summary>
+<div><strong>{address}</strong><br>{city}, {state} {zip_code}</div>
+<div>Price: {price_str} · HOA: {hoa_str}</div>
+<div>Days on Market: {dom_str} · Crime Index: {crime_str}</div>
+<div>{link}</div>
+</details>
+</div>"""
+
+
+def render_compact_card(row):
+    """Render a compact listing card from a DataFrame row.
+
+    All display strings were precomputed in _listings_df, so this is
+    pure substitution of row values into the module-level template.
     """
+    values = row._asdict()
+    values["link"] = (
+        f'<a href="{row.url}" target="_blank">View on Redfin →</a>' if row.url else ""
+    )
+    return _CARD_TEMPLATE.format_map(values)
 
 
-def filter_listings(listings, filters):
-    """Filter listings based on user selections."""
-    filtered = []
-    for l in listings:
-        if filters['min_price'] and l.price and l.price < filters['min_price']:
-            continue
-        if filters['max_price'] and l.price and l.price > filters['max_price']:
-            continue
-        if filters['min_beds'] and l.beds and l.beds < filters['min_beds']:
-            continue
-        if filters['min_baths'] and l.baths and l.baths < filters['min_baths']:
-            continue
-        if filters['min_sqft'] and l.sqft and l.sqft < filters['min_sqft']:
-            continue
-        if filters['cities'] and l.city not in filters['cities']:
-            continue
-        if filters['has_yard'] and not l.has_yard:
-            continue
-        if filters['has_pool'] and not l.has_pool:
-            continue
-        if filters['has_solar'] and not l.has_solar:
-            continue
-        if filters['max_age']:
-            current_year = datetime.now().year
-            if l.year_built and (current_year - l.year_built) > filters['max_age']:
-                continue
-        filtered.append(l)
-    return filtered
-
-
-def sort_listings(listings, sort_by):
-    """Sort listings by specified field."""
-    sort_config = {
-        "Value Score": (lambda x: x.value_score or 0, True),
-        "Price ↑": (lambda x: x.price or 0, False),
-        "Price ↓": (lambda x: x.price or 0, True),
-        "Largest": (lambda x: x.sqft or 0, True),
-        "Newest": (lambda x: x.year_built or 0, True),
-    }
-    key_func, reverse = sort_config.get(sort_by, (lambda x: x.value_score or 0, True))
-    return sorted(listings, key=key_func, reverse=reverse)
+@st.cache_data(ttl=300, show_spinner=False, max_entries=2000)
+def _card_html(version, position: int) -> str:
+    """Rendered card HTML, cached per listing per data version.
+
+    Filter and sort changes only alter which cards are visible, not
+    their markup, so a card revisited on a later rerun is a cache hit
+    instead of another template substitution.
+    """
+    row = next(_listings_df(version).iloc[[position]].itertuples(index=False))
+    return render_compact_card(row)
+
+
+def filter_listings(df, filters):
+    """Filter listings based on user selections.
+
+    Evaluates every criterion as a vectorized boolean mask over the
+    listings DataFrame and returns the surviving row positions, which
+    index straight into the listing list. Unknown values (price 0,
+    missing year) pass range filters, matching the per-listing branch
+    cascade this replaces.
+    """
+    if df.empty:
+        return np.array([], dtype=np.intp)
+
+    mask = np.ones(len(df), dtype=bool)
+
+    def _at_least(column, minimum):
+        values = df[column].fillna(0).to_numpy()
+        return (values == 0) | (values >= minimum)
+
+    if filters['min_price']:
+        mask &= _at_least('price', filters['min_price'])
+    if filters['max_price']:
+        prices = df['price'].fillna(0).to_numpy()
+        mask &= (prices == 0) | (prices <= filters['max_price'])
+    if filters['min_beds']:
+        mask &= _at_least('beds', filters['min_beds'])
+    if filters['min_baths']:
+        mask &= _at_least('baths', filters['min_baths'])
+    if filters['min_sqft']:
+        mask &= _at_least('sqft', filters['min_sqft'])
+    if filters['cities']:
+        mask &= df['city'].isin(filters['cities']).to_numpy()
+    if filters['has_yard']:
+        mask &= df['has_yard'].to_numpy()
+    if filters['has_pool']:
+        mask &= df['has_pool'].to_numpy()
+    if filters['has_solar']:
+        mask &= df['has_solar'].to_numpy()
+    if filters['max_age']:
+        years = df['year_built'].fillna(0).to_numpy()
+        mask &= (years == 0) | (datetime.now().year - years <= filters['max_age'])
+
+    return np.nonzero(mask)[0]
+
+
+# Cards per "Load more" click; 12 keeps the 4-column grid rows full
+_PAGE_SIZE = 12
+
+
+def _filters_key(filters):
+    """Hashable form of the filters dict, for change detection."""
+    return tuple(
+        (name, tuple(value) if isinstance(value, list) else value)
+        for name, value in filters.items()
+    )
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _filtered_indices(version, filters_key: tuple) -> np.ndarray:
+    """Memoized filter pass, keyed on the data version and filters.
+
+    Reruns with unchanged inputs - scrolling, paging, sort tweaks -
+    resolve to a cache hit instead of re-evaluating the masks.
+    """
+    return filter_listings(_listings_df(version), dict(filters_key))
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _sorted_indices(version, filters_key: tuple, sort_by: str) -> np.ndarray:
+    """Memoized sort of the filtered row positions."""
+    return sort_listings(
+        _listings_df(version), _filtered_indices(version, filters_key), sort_by
+    )
+
+
+# Sort options mapped to (DataFrame column, descending)
+_SORT_KEYS = {
+    "Value Score": ("value_score", True),
+    "Price ↑": ("price", False),
+    "Price ↓": ("price", True),
+    "Largest": ("sqft", True),
+    "Newest": ("year_built", True),
+}
+
+
+def sort_listings(df, indices, sort_by):
+    """Sort the filtered row positions by the selected field.
+
+    Orders the positions with a stable NumPy argsort over the sort
+    column, so comparisons run in C instead of a Python key lambda per
+    element. Missing values sort as 0, like the `or 0` key functions
+    this replaces.
+    """
+    column, descending = _SORT_KEYS.get(sort_by, ("value_score", True))
+    values = df[column].iloc[indices].fillna(0).to_numpy(dtype=np.float64)
+    order = np.argsort(-values if descending else values, kind="stable")
+    return indices[order]
 
 
 def main():
@@ -431,51 +429,56 @@ def main():
 
         col1, col2 = st.columns(2)
         with col1:
-            min_price = st.number_input("Min $", value=400000, step=25000, format="%d")
+            min_price = st.number_input("Min $", value=400000, step=25000, format="%d", key="min_price")
         with col2:
-            max_price = st.number_input("Max $", value=700000, step=25000, format="%d")
+            max_price = st.number_input("Max $", value=700000, step=25000, format="%d", key="max_price")
 
         col1, col2 = st.columns(2)
         with col1:
-            min_beds = st.selectbox("Beds", options=[1, 2, 3, 4, 5], index=2)
+            min_beds = st.selectbox("Beds", options=[1, 2, 3, 4, 5], index=2, key="min_beds")
         with col2:
-            min_baths = st.selectbox("Baths", options=[1, 1.5, 2, 2.5, 3, 3.5, 4], index=2)
+            min_baths = st.selectbox("Baths", options=[1, 1.5, 2, 2.5, 3, 3.5, 4], index=2, key="min_baths")
 
-        min_sqft = st.number_input("Min Sqft", value=1200, step=100, format="%d")
+        min_sqft = st.number_input("Min Sqft", value=1200, step=100, format="%d", key="min_sqft")
 
         all_cities = ['Gilbert', 'Chandler', 'Scottsdale', 'Paradise Valley', 'Surprise', 'Mesa', 'Queen Creek',
                       'Apache Junction', 'Tucson', 'Green Valley', 'Oro Valley', 'Marana', 'Vail']
         default_cities = ['Gilbert', 'Chandler', 'Scottsdale', 'Paradise Valley', 'Surprise', 'Queen Creek', 'Green Valley', 'Oro Valley']
-        cities = st.multiselect("Cities", options=all_cities, default=default_cities)
+        cities = st.multiselect("Cities", options=all_cities, default=default_cities, key="cities")
 
         st.markdown("**Features**")
         col1, col2, col3 = st.columns(3)
         with col1:
-            has_yard = st.checkbox("Yard")
+            has_yard = st.checkbox("Yard", key="has_yard")
         with col2:
-            has_pool = st.checkbox("Pool")
+            has_pool = st.checkbox("Pool", key="has_pool")
         with col3:
-            has_solar = st.checkbox("Solar")
+            has_solar = st.checkbox("Solar", key="has_solar")
 
         max_age = st.selectbox("Max Age", options=[None, 5, 10, 20, 30], index=4,
-                               format_func=lambda x: "Any" if x is None else f"{x} yrs")
+                               format_func=lambda x: "Any" if x is None else f"{x} yrs",
+                               key="max_age")
 
         st.divider()
 
         if st.button("🔄 Refresh Data", use_container_width=True):
             refresh_data()
 
-        if st.button("📥 Export CSV", use_container_width=True):
-            if st.session_state.listings:
-                df = pd.DataFrame([l.to_dict() for l in st.session_state.listings])
-                st.download_button("Download", df.to_csv(index=False),
-                                   f"listings_{datetime.now().strftime('%Y%m%d')}.csv", "text/csv")
-
-    # Load listings
-    if not st.session_state.listings:
-        load_listings_from_db()
-
-    listings = st.session_state.listings
+        # Single-click download of the cached CSV; the old button-then-
+        # download flow rebuilt the DataFrame on every sidebar redraw
+        # and lost the nested button across reruns
+        st.download_button(
+            "📥 Export CSV",
+            data=_listings_csv(_data_version()),
+            file_name=f"listings_{datetime.now().strftime('%Y%m%d')}.csv",
+            mime="text/csv",
+            use_container_width=True,
+        )
+
+    # Load the column view; filtering, sorting, and rendering all run
+    # off the cached DataFrame snapshot
+    load_listings_from_db()
+    df = _listings_df(_data_version())
 
     # Build filters
     filters = {
@@ -486,27 +489,48 @@ def main():
         'max_age': max_age
     }
 
-    filtered = filter_listings(listings, filters)
+    _results(df, _filters_key(filters))
+
+
+@st.fragment
+def _results(df, filters_key):
+    """Stats, view toggle, and listing grid for the current filters.
+
+    A fragment, so its own widgets - the sort selectbox, the view
+    radio, and the Load more button - rerun just this section instead
+    of the whole script. Sidebar changes still trigger full reruns
+    (fragments cannot render widgets into the sidebar), but those are
+    cheap: everything above here is served from the caches.
+    """
+    filtered_idx = _filtered_indices(_data_version(), filters_key)
 
-    # Stats row
+    # Stats row: single NumPy reductions over the filtered columns
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Homes", len(filtered))
+        st.metric("Homes", len(filtered_idx))
     with col2:
-        avg_score = sum(l.value_score or 0 for l in filtered) / len(filtered) if filtered else 0
+        if len(filtered_idx):
+            scores = df['value_score'].to_numpy(dtype=np.float64)[filtered_idx]
+            avg_score = np.nan_to_num(scores).mean()
+        else:
+            avg_score = 0
         st.metric("Avg Score", f"{avg_score:.0f}")
     with col3:
-        prices = [l.price for l in filtered if l.price]
-        price_range = f"{format_compact_price(min(prices))}-{format_compact_price(max(prices))}" if prices else "--"
+        prices = df['price'].to_numpy(dtype=np.float64)[filtered_idx] if len(filtered_idx) else np.array([])
+        prices = prices[prices > 0]
+        if prices.size:
+            price_range = f"{format_compact_price(prices.min())}-{format_compact_price(prices.max())}"
+        else:
+            price_range = "--"
         st.metric("Price Range", price_range)
     with col4:
         sort_by = st.selectbox("Sort", ["Value Score", "Price ↑", "Price ↓", "Largest", "Newest"],
-                               label_visibility="collapsed")
+                               label_visibility="collapsed", key="sort_by")
 
-    sorted_listings = sort_listings(filtered, sort_by)
+    sorted_idx = _sorted_indices(_data_version(), filters_key, sort_by)
 
     # Empty state
-    if not sorted_listings:
+    if not len(sorted_idx):
         st.markdown("---")
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
@@ -521,30 +545,48 @@ def main():
                 refresh_data()
         return
 
-    # Grid of cards - 4 columns on desktop
+    view = st.radio(
+        "View", ["Cards", "Table"], horizontal=True, label_visibility="collapsed",
+        key="view"
+    )
+
+    # Table view: st.dataframe renders windowed, so only visible rows
+    # reach the DOM no matter how many survived the filters
+    if view == "Table":
+        table_columns = [
+            "value_score", "price", "beds", "baths", "sqft",
+            "city", "year_built", "days_on_market",
+        ]
+        st.dataframe(
+            df.iloc[sorted_idx][table_columns],
+            use_container_width=True,
+            hide_index=True,
+        )
+        return
+
+    # Paginate: only build HTML for the cards revealed so far, and reset
+    # to the first page whenever the filters, sort, or data change
+    page_key = (filters_key, sort_by, _data_version())
+    if st.session_state.get('page_key') != page_key:
+        st.session_state.page = 1
+        st.session_state.page_key = page_key
+
+    visible_idx = sorted_idx[:st.session_state.page * _PAGE_SIZE]
+
+    # Grid of cards - one markdown call for the whole page instead of a
+    # component round-trip per card; per-card details are native
+    # <details> elements, so no expander components either
     st.markdown("---")
-    cols_per_row = 4
-
-    for row_start in range(0, min(len(sorted_listings), 60), cols_per_row):
-        cols = st.columns(cols_per_row)
-        for i, col in enumerate(cols):
-            idx = row_start + i
-            if idx < len(sorted_listings):
-                listing = sorted_listings[idx]
-                with col:
-                    st.markdown(render_compact_card(listing), unsafe_allow_html=True)
-                    with st.expander("Details"):
-                        st.write(f"**{listing.address}**")
-                        st.write(f"{listing.city}, {listing.state} {listing.zip_code}")
-                        st.write(f"**Price:** {format_price(listing.price)}")
-                        st.write(f"**HOA:** {'$' + str(listing.hoa_monthly) + '/mo' if listing.hoa_monthly else 'None'}")
-                        st.write(f"**Days on Market:** {listing.days_on_market or 'N/A'}")
-                        st.write(f"**Crime Index:** {listing.crime_index or 'N/A'}")
-                        if listing.url:
-                            st.link_button("View on Redfin →", listing.url, use_container_width=True)
-
-    if len(sorted_listings) > 60:
-        st.info(f"Showing 60 of {len(sorted_listings)} listings. Adjust filters to narrow results.")
+
+    version = _data_version()
+    cards_html = "\n".join(_card_html(version, int(i)) for i in visible_idx)
+    st.markdown(f'<div class="card-grid">{cards_html}</div>', unsafe_allow_html=True)
+
+    remaining = len(sorted_idx) - len(visible_idx)
+    if remaining > 0:
+        if st.button(f"Load more ({remaining} remaining)", use_container_width=True):
+            st.session_state.page += 1
+            st.rerun(scope="fragment")
 
 
 if __name__ == "__main__":